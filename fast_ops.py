@@ -0,0 +1,106 @@
+"""
+Shared numeric kernels for modules working on the fetched column arrays.
+
+Uses Numba when installed (compiled once, cached on disk); falls back to
+equivalent NumPy code otherwise, so modules can import this unconditionally.
+The public functions coerce their input to float64 first, so both backends
+see the same dtype and give the same results (x/0 -> inf/nan, never raises).
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_OK = True
+except Exception:
+    NUMBA_OK = False
+
+
+# ---- NumPy backend (always available; also the reference for tests) ----
+def _rolling_mean_np(x, w):
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if w <= 0 or w > n:
+        return out
+    csum = np.concatenate(([0.0], np.cumsum(x)))
+    out[w - 1:] = (csum[w:] - csum[:-w]) / w
+    return out
+
+
+def _pct_change_np(x):
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[1:] = x[1:] / x[:-1] - 1.0
+    return out
+
+
+def _zscore_matrix_np(ys):
+    mu = ys.mean(axis=1, keepdims=True)
+    sd = ys.std(axis=1, keepdims=True)
+    out = np.zeros_like(ys)
+    np.divide(ys - mu, sd, out=out, where=sd > 0)
+    return out
+
+
+# ---- Numba backend; error_model='numpy' so x/0 gives inf/nan like NumPy ----
+if NUMBA_OK:
+    @njit(cache=True, parallel=True, error_model="numpy")
+    def _rolling_mean_nb(x, w):
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        if w <= 0 or w > n:
+            return out
+        csum = np.empty(n + 1)
+        csum[0] = 0.0
+        for i in range(n):
+            csum[i + 1] = csum[i] + x[i]
+        for i in prange(w - 1, n):
+            out[i] = (csum[i + 1] - csum[i + 1 - w]) / w
+        return out
+
+    @njit(cache=True, error_model="numpy")
+    def _pct_change_nb(x):
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        for i in range(1, n):
+            out[i] = x[i] / x[i - 1] - 1.0
+        return out
+
+    @njit(cache=True, parallel=True, error_model="numpy")
+    def _zscore_matrix_nb(ys):
+        rows, cols = ys.shape
+        out = np.zeros((rows, cols))
+        for r in prange(rows):
+            mu = ys[r].mean()
+            sd = ys[r].std()
+            if sd > 0.0:
+                for c in range(cols):
+                    out[r, c] = (ys[r, c] - mu) / sd
+        return out
+
+    _rolling_mean, _pct_change, _zscore_matrix = _rolling_mean_nb, _pct_change_nb, _zscore_matrix_nb
+else:
+    _rolling_mean, _pct_change, _zscore_matrix = _rolling_mean_np, _pct_change_np, _zscore_matrix_np
+
+
+def _as_f64(x, ndim: int) -> np.ndarray:
+    # One dtype/layout for both backends (and one numba specialisation)
+    arr = np.ascontiguousarray(x, dtype=np.float64)
+    if arr.ndim != ndim:
+        raise ValueError(f"expected a {ndim}-D array, got shape {arr.shape}")
+    return arr
+
+
+def rolling_mean(x, w):
+    """Trailing mean over w samples; the first w-1 outputs are NaN."""
+    return _rolling_mean(_as_f64(x, 1), int(w))
+
+
+def pct_change(x):
+    """x[i] / x[i-1] - 1; the first output is NaN."""
+    return _pct_change(_as_f64(x, 1))
+
+
+def zscore_matrix(ys):
+    """Standardise each row of ys (one series per row); flat rows become 0."""
+    return _zscore_matrix(_as_f64(ys, 2))
@@ -1,15 +1,36 @@
 # modules/livetracker.py
 from __future__ import annotations
 
+import bisect
+import contextlib
+import json
 import math
+import os
+import sys
 import time
-import threading
+import urllib.parse
 import datetime as dt
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+try:
+    import requests_cache  # optional on-disk HTTP cache with conditional GETs
+    from requests_cache import DO_NOT_CACHE
+    REQUESTS_CACHE_OK = True
+except Exception:
+    REQUESTS_CACHE_OK = False
+
+try:
+    import orjson  # optional, faster decode of the 1m bar payloads
+    _json_loads = orjson.loads
+except Exception:
+    _json_loads = json.loads
+
 # Match NewsTicker import style
 from plugin_api import BaseModule
 
@@ -26,24 +47,78 @@ YA_CHART_DAILY = (
     "{symbol}?period1={p1}&period2={p2}&interval=1d&includePrePost=false&events=history"
 )
 
+# Batched quotes (one request for many symbols)
+YA_QUOTE = "https://query1.finance.yahoo.com/v7/finance/quote?symbols={symbols}"
+QUOTE_CHUNK = 50  # keep the query string well under URL length limits
+
 # 1-minute bars for crypto since-local-midnight calc
 YA_CHART_1M = (
     "https://query1.finance.yahoo.com/v8/finance/chart/"
     "{symbol}?period1={p1}&period2={p2}&interval=1m&includePrePost=false"
 )
 
+# Daily-meta cache. Both endpoints return quote and meta fields together, so one TTL covers
+# the lot; a last-known quote is served for up to TTL_STALE while refetches keep failing.
+TTL_QUOTE = 10
+TTL_STALE = 3600
+TTL_MIDNIGHT = 3600  # re-check the crypto midnight bar hourly as a sanity check
+META_FIELDS = ("prev_close", "currency", "inst")  # carried over when a response leaves them blank
+HTTP_CACHE_NAME = "livetracker"  # requests-cache SQLite file (without extension)
+HTTP_CACHE_PURGE = 600  # seconds between sweeps of expired HTTP cache entries
+# Chart URLs carry period2=now, so each one is a fresh cache key: storing them only grows the file
+HTTP_NO_CACHE_URLS = ("query1.finance.yahoo.com/v8/finance/chart/",)
+
+# Free-threaded CPython (3.13t) runs the I/O pool's per-symbol parsing truly in parallel
+GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+IO_WORKERS = 8 if GIL_ENABLED else max(8, os.cpu_count() or 8)
+
 SETTINGS_SCOPE = "StockTool/LiveTracker"
 SET_REFRESH_SEC = "refresh_seconds"
 
 
+def _scan_intraday(ts: List[int], closes: List[Optional[float]], midnight_utc: int) -> Tuple[Optional[float], Optional[float]]:
+    """(first close at/after midnight_utc, most recent close) from ascending 1m bars."""
+    n = min(len(ts), len(closes))
+    # ts is ascending: jump to midnight, then skip empty bars
+    i = bisect.bisect_left(ts, midnight_utc, 0, n)
+    while i < n and closes[i] is None:
+        i += 1
+    midnight_px = float(closes[i]) if i < n else None
+
+    # Bounded reverse scan for the most recent non-empty bar
+    last_px = None
+    for j in range(len(closes) - 1, max(-1, len(closes) - 60), -1):
+        if closes[j] is not None:
+            last_px = float(closes[j])
+            break
+    return midnight_px, last_px
+
+
+class Quote(NamedTuple):
+    """One symbol's row as produced by a refresh (a tuple, so no per-instance dict)."""
+    symbol: str
+    price: Optional[float]
+    prev_close: Optional[float]
+    high: Optional[float]
+    low: Optional[float]
+    vol: Optional[int]
+    currency: str
+    inst: str
+    tstr: str
+    is_crypto: bool
+    chg: Optional[float]
+    pct: Optional[float]
+
+    @property
+    def chg_basis(self) -> str:
+        return "since_local_midnight" if self.is_crypto else "prev_close"
+
+
 class LivePriceTrackerModule(BaseModule):
     MODULE_ID   = "live_price_tracker"
     MODULE_NAME = "Live Price Tracker"
     MODULE_DESC = "Live quotes. Stocks: change vs prev close. Crypto: % since your local midnight."
 
-    pricesSig = QtCore.pyqtSignal(dict)  # {"AAPL": {...}, "BTC-USD": {...}}
-    statusSig = QtCore.pyqtSignal(str)
-
     COL_SYMBOL = 0
     COL_PRICE  = 1
     COL_CHG    = 2
@@ -57,20 +132,57 @@ class LivePriceTrackerModule(BaseModule):
         super().__init__(parent)
         self._running = False
         self._symbols: List[str] = []
-        self._row_for_sym: Dict[str, int] = {}
-        self._last: Dict[str, dict] = {}
-
-        self._session = requests.Session()
+        self._last_synced_symbols: Tuple[str, ...] = ()
+        self._last: Dict[str, Quote] = {}
+        # sym -> (time.monotonic() stored, fields)
+        self._daily_cache: Dict[str, Tuple[float, dict]] = {}
+        # (sym, local date) -> (time.monotonic() stored, close at local midnight)
+        self._midnight_px: Dict[Tuple[str, dt.date], Tuple[float, float]] = {}
+
+        # Dedicated single-thread Qt pool runs refreshes; HTTP calls fan out to the I/O pool
+        self._scheduler = QtCore.QThreadPool(self)
+        self._scheduler.setMaxThreadCount(1)
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="lt-io")
+        self._inflight = False
+        self._last_purge: Optional[float] = None  # time.monotonic() of the last HTTP cache sweep
+
+        if REQUESTS_CACHE_OK:
+            # Survives restarts; honours Cache-Control/ETag so repeats can be 304s
+            self._session = requests_cache.CachedSession(
+                cache_name=os.path.join(self._cache_dir(), HTTP_CACHE_NAME),
+                backend="sqlite",
+                expire_after=10,
+                urls_expire_after={url: DO_NOT_CACHE for url in HTTP_NO_CACHE_URLS},
+                cache_control=True,
+                allowable_methods=("GET",),
+            )
+        else:
+            self._session = requests.Session()
         self._session.headers.update(HEADERS)
+        # Keep-alive pool sized for concurrent fetches; Yahoo can 401/429 transiently
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[401, 429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+            ),
+        )
+        self._session.mount("https://", adapter)
 
         self._build_ui()
 
         self._refresh_timer = QtCore.QTimer(self)
         self._refresh_timer.timeout.connect(self._kick_refresh)
 
-        self.pricesSig.connect(self._merge_prices_ui)
-        # Use a defined status slot
-        self.statusSig.connect(self._on_status)
+        # Coalesce bursts of refresh results into one table merge
+        self._pending_prices: Dict[str, Quote] = {}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_prices)
 
         # ---- settings (these EXIST below) ----
         self._load_settings()
@@ -113,12 +225,20 @@ class LivePriceTrackerModule(BaseModule):
 
         self._filter = QtWidgets.QLineEdit()
         self._filter.setPlaceholderText("Filter (e.g., AAPL, BTC-USD)")
-        self._filter.textChanged.connect(self._apply_filter)
 
-        self._table = QtWidgets.QTableWidget(0, 8)
-        self._table.setHorizontalHeaderLabels(
-            ["Symbol", "Price", "Change", "Change %", "High", "Low", "Volume", "Updated"]
-        )
+        self._model = QuoteTableModel(self)
+        # Filtering happens in the proxy; no per-row hide calls
+        self._proxy = QtCore.QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setFilterKeyColumn(self.COL_SYMBOL)
+        self._proxy.setSortRole(QuoteTableModel.SORT_ROLE)
+        self._proxy.setFilterCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+        # Symbols never change in a price update, so don't re-filter on every dataChanged
+        self._proxy.setDynamicSortFilter(False)
+        self._filter.textChanged.connect(lambda text: self._proxy.setFilterFixedString(text.strip()))
+
+        self._table = QtWidgets.QTableView()
+        self._table.setModel(self._proxy)
         self._table.setAlternatingRowColors(True)
         self._table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self._table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
@@ -128,13 +248,14 @@ class LivePriceTrackerModule(BaseModule):
         self._table.verticalHeader().setDefaultSectionSize(24)
         hh = self._table.horizontalHeader()
         hh.setStretchLastSection(False)
-        hh.setSectionResizeMode(self.COL_SYMBOL, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        hh.setSectionResizeMode(self.COL_PRICE,  QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        hh.setSectionResizeMode(self.COL_CHG,    QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        hh.setSectionResizeMode(self.COL_PCT,    QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        hh.setSectionResizeMode(self.COL_HIGH,   QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        hh.setSectionResizeMode(self.COL_LOW,    QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        hh.setSectionResizeMode(self.COL_VOL,    QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        # Fixed, user-adjustable widths: ResizeToContents re-measures every cell on each update
+        widths = {
+            self.COL_SYMBOL: 90, self.COL_PRICE: 90, self.COL_CHG: 90, self.COL_PCT: 90,
+            self.COL_HIGH: 90, self.COL_LOW: 90, self.COL_VOL: 110,
+        }
+        for col, w in widths.items():
+            hh.setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeMode.Interactive)
+            hh.resizeSection(col, w)
         hh.setSectionResizeMode(self.COL_TIME,   QtWidgets.QHeaderView.ResizeMode.Stretch)
 
         self._status = QtWidgets.QLabel("")
@@ -156,8 +277,11 @@ class LivePriceTrackerModule(BaseModule):
     def on_disable(self):
         self._running = False
         self._refresh_timer.stop()
+        self._scheduler.clear()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
 
-    def on_data(self, data_by_symbol: Dict[str, List[dict]], tickers: List[str]):
+    def on_data_arrays(self, arrays_by_symbol: Dict[str, dict], tickers: List[str]):
+        # Only the ticker list matters here; skip the base class's row conversion
         self._symbols = [s.strip().upper() for s in tickers if s.strip()]
         self._sync_rows_to_symbols()
         self._count.setText(f"{len(self._symbols)} symbols")
@@ -172,22 +296,15 @@ class LivePriceTrackerModule(BaseModule):
     def _kick_refresh(self):
         if not self._running or not self._symbols:
             return
-        t = threading.Thread(target=self._refresh_worker, daemon=True)
-        t.start()
-
-    def _refresh_worker(self):
-        try:
-            prices = self._fetch_prices_combo(self._symbols)
-            self.pricesSig.emit(prices)
-            self.statusSig.emit(f"Updated {len(prices)} symbols.")
-        except Exception as e:
-            self.statusSig.emit(f"Refresh error: {e}")
+        if self._inflight:
+            return  # previous refresh still running; don't pile up
+        self._inflight = True
+        self._scheduler.start(RefreshTask(self, list(self._symbols)))
 
     # ---------------- Fetch logic (stocks + crypto) ----------------
-    def _fetch_prices_combo(self, symbols: List[str]) -> Dict[str, dict]:
-        out: Dict[str, dict] = {}
+    def _fetch_prices_combo(self, symbols: List[str]) -> Dict[str, Quote]:
         if not symbols:
-            return out
+            return {}
 
         now_utc = dt.datetime.now(dt.timezone.utc)
         now_ts = int(now_utc.timestamp())
@@ -200,172 +317,288 @@ class LivePriceTrackerModule(BaseModule):
         p2 = now_ts
         p1 = now_ts - 14 * 24 * 3600  # 14 days daily window ensures a prev bar exists
 
-        daily_meta: Dict[str, dict] = {}
-        for sym in symbols:
-            js = self._safe_chart_json(YA_CHART_DAILY.format(symbol=sym, p1=p1, p2=p2))
-            if not js:
-                continue
-            res = (js.get("chart") or {}).get("result") or []
-            if not res:
-                continue
-            node = res[0]
-            meta = node.get("meta") or {}
-            qlist = (node.get("indicators") or {}).get("quote") or []
-            highs = lows = vols = closes = []
-            if qlist:
-                q = qlist[0]
-                highs  = q.get("high") or []
-                lows   = q.get("low")  or []
-                vols   = q.get("volume") or []
-                closes = q.get("close") or []
-
-            price = meta.get("regularMarketPrice")
-            if price is None and closes:
-                last = closes[-1]
-                if last is not None:
-                    price = float(last)
-
-            prev_close = meta.get("previousClose")
-            if prev_close is None and len(closes) >= 2 and closes[-2] is not None:
-                prev_close = float(closes[-2])
-
-            market_time = meta.get("regularMarketTime") or 0
-            tstr = self._fmt_time(market_time)
-
-            daily_meta[sym] = {
-                "inst": (meta.get("instrumentType") or "").upper(),
-                "currency": meta.get("currency") or "",
-                "price": float(price) if price is not None else None,
-                "prev_close": float(prev_close) if prev_close is not None else None,
-                "high": float(highs[-1]) if highs else None,
-                "low":  float(lows[-1]) if lows else None,
-                "vol":  int(vols[-1]) if vols else None,
-                "tstr": tstr,
-            }
-
-        for sym in symbols:
+        daily_meta = self._get_daily_meta(symbols, p1, p2)
+
+        crypto_syms = [
+            s for s in symbols
+            if s in daily_meta and (daily_meta[s]["inst"] == "CRYPTOCURRENCY" or s.endswith("-USD"))
+        ]
+        intraday: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+
+        # The midnight reference only changes once a day: reuse it with the quote price
+        today = local_midnight.date()
+        now_mono = time.monotonic()
+        need_bars: List[str] = []
+        for sym in crypto_syms:
+            cached = self._midnight_px.get((sym, today))
+            price = daily_meta[sym].get("price")
+            if cached and price is not None and now_mono - cached[0] < TTL_MIDNIGHT:
+                intraday[sym] = (cached[1], price)
+            else:
+                need_bars.append(sym)
+
+        # Crypto without a cached reference needs its own 1m call; run those concurrently
+        if need_bars:
+            results = self._io_pool.map(
+                lambda s: self._fetch_crypto_intraday(s, midnight_utc, now_ts, daily_meta[s].get("price")),
+                need_bars,
+            )
+            now_mono = time.monotonic()
+            for sym, midnight_px, latest_px in results:
+                intraday[sym] = (midnight_px, latest_px)
+                if midnight_px is not None:
+                    self._midnight_px[(sym, today)] = (now_mono, midnight_px)
+            # Drop references from previous days
+            for key in [k for k in self._midnight_px if k[1] != today]:
+                self._midnight_px.pop(key, None)
+
+        # Single pass into parallel columns indexed like `symbols`
+        n = len(symbols)
+        present: List[bool] = [False] * n
+        crypto: List[bool] = [False] * n
+        prices: List[Optional[float]] = [None] * n
+        prev_closes: List[Optional[float]] = [None] * n
+        chgs: List[Optional[float]] = [None] * n
+        pcts: List[Optional[float]] = [None] * n
+        highs: List[Optional[float]] = [None] * n
+        lows: List[Optional[float]] = [None] * n
+        vols: List[Optional[int]] = [None] * n
+        currencies: List[str] = [""] * n
+        insts: List[str] = [""] * n
+        tstrs: List[str] = [""] * n
+
+        for i, sym in enumerate(symbols):
             base = daily_meta.get(sym)
             if not base:
                 continue
+            present[i] = True
+            highs[i] = base.get("high")
+            lows[i] = base.get("low")
+            vols[i] = base.get("vol")
+            currencies[i] = base.get("currency") or ""
+            insts[i] = base.get("inst") or ""
+            tstrs[i] = base.get("tstr") or ""
+            prev_closes[i] = base.get("prev_close")
+
+            if sym in intraday:
+                # Crypto: change since local midnight
+                crypto[i] = True
+                ref, price = intraday[sym]
+            else:
+                # Stocks: change vs previous close
+                ref, price = base.get("prev_close"), base.get("price")
+            prices[i] = price
+            if price is not None and ref not in (None, 0):
+                chgs[i] = float(price) - float(ref)
+                pcts[i] = (chgs[i] / float(ref)) * 100.0
+
+        return {
+            sym: Quote(
+                symbol=sym,
+                price=prices[i],
+                prev_close=prev_closes[i],
+                high=highs[i],
+                low=lows[i],
+                vol=vols[i],
+                currency=currencies[i],
+                inst=insts[i],
+                tstr=tstrs[i],
+                is_crypto=crypto[i],
+                chg=chgs[i],
+                pct=pcts[i],
+            )
+            for i, sym in enumerate(symbols) if present[i]
+        }
+
+    def _fetch_crypto_intraday(
+        self, sym: str, midnight_utc: int, now_ts: int, latest_px: Optional[float]
+    ) -> Tuple[str, Optional[float], Optional[float]]:
+        """(sym, midnight_px, latest_px) from 1m bars (with a 5m buffer before midnight)."""
+        url = YA_CHART_1M.format(symbol=sym, p1=midnight_utc - 300, p2=now_ts)
+        node = self._chart_node(self._safe_chart_json(url))
+        midnight_px = None
+
+        if node is not None:
+            ts = node.get("timestamp") or []
+            closes = self._chart_quote(node).get("close") or []
+            midnight_px, last_px = _scan_intraday(ts, closes, midnight_utc)
+            if latest_px is None:
+                latest_px = last_px
+
+        return sym, midnight_px, latest_px
+
+    def _get_daily_meta(self, symbols: List[str], p1: int, p2: int) -> Dict[str, dict]:
+        """Daily meta per symbol, served from the TTL caches where still fresh."""
+        now = time.monotonic()
+        stale = [
+            s for s in symbols
+            if s not in self._daily_cache or now - self._daily_cache[s][0] >= TTL_QUOTE
+        ]
+
+        if stale:
+            # One batched quote call for everything; daily chart only for what it missed
+            fetched = self._fetch_quotes_batch(stale)
+            missing = [sym for sym in stale if sym not in fetched]
+            for sym, meta in zip(missing, self._io_pool.map(
+                    lambda sym: self._fetch_daily_chart(sym, p1, p2), missing)):
+                if meta:
+                    fetched[sym] = meta
+
+            now = time.monotonic()
+            for sym, info in fetched.items():
+                cached = self._daily_cache.get(sym)
+                if cached:
+                    # Keep what we already know if this response left a meta field blank
+                    for k in META_FIELDS:
+                        if info.get(k) in (None, "") and cached[1].get(k) not in (None, ""):
+                            info[k] = cached[1][k]
+                self._daily_cache[sym] = (now, info)
 
-            inst = base["inst"]
-            is_crypto = (inst == "CRYPTOCURRENCY") or sym.endswith("-USD")
-
-            if is_crypto:
-                # 1m since local midnight (with 5m buffer)
-                js = self._safe_chart_json(YA_CHART_1M.format(symbol=sym, p1=midnight_utc - 300, p2=now_ts))
-                midnight_px = None
-                latest_px = base.get("price")
-
-                if js:
-                    res = (js.get("chart") or {}).get("result") or []
-                    if res:
-                        node = res[0]
-                        ts = node.get("timestamp") or []
-                        ql = (node.get("indicators") or {}).get("quote") or []
-                        closes = (ql[0].get("close") or []) if ql else []
-                        for tval, cval in zip(ts, closes):
-                            if cval is None:
-                                continue
-                            if int(tval) >= midnight_utc:
-                                midnight_px = float(cval)
-                                break
-                        if latest_px is None and closes:
-                            last = closes[-1]
-                            if last is not None:
-                                latest_px = float(last)
-
-                chg = pct = None
-                if midnight_px is not None and latest_px is not None and midnight_px != 0:
-                    chg = latest_px - midnight_px
-                    pct = (chg / midnight_px) * 100.0
+        out: Dict[str, dict] = {}
+        for sym in symbols:
+            cached = self._daily_cache.get(sym)
+            if cached and now - cached[0] < TTL_STALE:
+                out[sym] = cached[1]
+        return out
 
+    def _fetch_quotes_batch(self, symbols: List[str]) -> Dict[str, dict]:
+        """Daily meta for many symbols via the v7 quote endpoint, keyed by symbol."""
+        out: Dict[str, dict] = {}
+        for i in range(0, len(symbols), QUOTE_CHUNK):
+            group = symbols[i:i + QUOTE_CHUNK]
+            url = YA_QUOTE.format(symbols=urllib.parse.quote(",".join(group), safe=","))
+            js = self._safe_json(url)
+            if not js:
+                continue
+            results = (js.get("quoteResponse") or {}).get("result") or []
+            for q in results:
+                sym = (q.get("symbol") or "").upper()
+                if not sym:
+                    continue
+                price = q.get("regularMarketPrice")
+                prev_close = q.get("regularMarketPreviousClose")
+                if prev_close is None:
+                    prev_close = q.get("previousClose")
+                high = q.get("regularMarketDayHigh")
+                low  = q.get("regularMarketDayLow")
+                vol  = q.get("regularMarketVolume")
                 out[sym] = {
-                    "symbol": sym,
-                    "is_crypto": True,
-                    "price": latest_px,
-                    "chg": chg,
-                    "pct": pct,
-                    "chg_basis": "since_local_midnight",
-                    "high": base.get("high"),
-                    "low":  base.get("low"),
-                    "vol":  base.get("vol"),
-                    "currency": base.get("currency"),
-                    "tstr": base.get("tstr"),
+                    "inst": (q.get("quoteType") or q.get("instrumentType") or "").upper(),
+                    "currency": q.get("currency") or "",
+                    "price": float(price) if price is not None else None,
+                    "prev_close": float(prev_close) if prev_close is not None else None,
+                    "high": float(high) if high is not None else None,
+                    "low":  float(low) if low is not None else None,
+                    "vol":  int(vol) if vol is not None else None,
+                    "tstr": self._fmt_time(q.get("regularMarketTime") or 0),
                 }
+        return out
 
-            else:
-                price = base.get("price")
-                prev_close = base.get("prev_close")
-                chg = pct = None
-                if price is not None and prev_close not in (None, 0):
-                    chg = float(price) - float(prev_close)
-                    pct = (chg / float(prev_close)) * 100.0
+    def _fetch_daily_chart(self, sym: str, p1: int, p2: int) -> Optional[dict]:
+        """Fallback daily meta from the chart endpoint for a symbol the batch missed."""
+        node = self._chart_node(self._safe_chart_json(YA_CHART_DAILY.format(symbol=sym, p1=p1, p2=p2)))
+        if node is None:
+            return None
+        meta = node.get("meta") or {}
+        q = self._chart_quote(node)
+        highs  = q.get("high") or []
+        lows   = q.get("low")  or []
+        vols   = q.get("volume") or []
+        closes = q.get("close") or []
+
+        price = meta.get("regularMarketPrice")
+        if price is None and closes:
+            last = closes[-1]
+            if last is not None:
+                price = float(last)
+
+        prev_close = meta.get("previousClose")
+        if prev_close is None and len(closes) >= 2 and closes[-2] is not None:
+            prev_close = float(closes[-2])
+
+        market_time = meta.get("regularMarketTime") or 0
+        tstr = self._fmt_time(market_time)
+
+        return {
+            "inst": (meta.get("instrumentType") or "").upper(),
+            "currency": meta.get("currency") or "",
+            "price": float(price) if price is not None else None,
+            "prev_close": float(prev_close) if prev_close is not None else None,
+            "high": float(highs[-1]) if highs else None,
+            "low":  float(lows[-1]) if lows else None,
+            "vol":  int(vols[-1]) if vols else None,
+            "tstr": tstr,
+        }
 
-                out[sym] = {
-                    "symbol": sym,
-                    "is_crypto": False,
-                    "price": price,
-                    "chg": chg,
-                    "pct": pct,
-                    "chg_basis": "prev_close",
-                    "high": base.get("high"),
-                    "low":  base.get("low"),
-                    "vol":  base.get("vol"),
-                    "currency": base.get("currency"),
-                    "tstr": base.get("tstr"),
-                }
+    # ---------------- HTTP helpers ----------------
+    def _safe_json(self, url: str, timeout: int = 12) -> Optional[dict]:
+        # Retries/backoff are handled by the session's HTTPAdapter
+        try:
+            r = self._session.get(url, timeout=timeout)
+            r.raise_for_status()
+            return _json_loads(r.content)
+        except Exception:
+            return None
 
-        return out
+    @staticmethod
+    def _chart_node(js: Optional[dict]) -> Optional[dict]:
+        """First result node of a chart response, or None."""
+        try:
+            return js["chart"]["result"][0]
+        except (KeyError, IndexError, TypeError):
+            return None
 
-    # ---------------- HTTP helpers ----------------
-    def _safe_chart_json(self, url: str, retries: int = 2, timeout: int = 12) -> Optional[dict]:
-        last = None
-        for _ in range(max(1, retries)):
-            try:
-                r = self._session.get(url, timeout=timeout)
-                if r.status_code == 401:
-                    # retry once; Yahoo can 401 transiently
-                    r = self._session.get(url, timeout=timeout)
-                r.raise_for_status()
-                js = r.json()
-                if (js.get("chart") or {}).get("error"):
-                    return None
-                return js
-            except Exception as e:
-                last = e
-                time.sleep(0.2)
-        return None
+    @staticmethod
+    def _chart_quote(node: dict) -> dict:
+        """First indicators.quote entry of a chart node (empty if absent)."""
+        try:
+            return node["indicators"]["quote"][0] or {}
+        except (KeyError, IndexError, TypeError):
+            return {}
+
+    def _safe_chart_json(self, url: str, timeout: int = 12) -> Optional[dict]:
+        js = self._safe_json(url, timeout=timeout)
+        if not js or (js.get("chart") or {}).get("error"):
+            return None
+        return js
 
     # ---------------- UI merge & rendering ----------------
     @QtCore.pyqtSlot(dict)
-    def _merge_prices_ui(self, fresh: Dict[str, dict]):
+    def _queue_prices(self, fresh: Dict[str, Quote]):
         if not fresh:
             return
-        self._sync_rows_to_symbols()
+        self._pending_prices.update(fresh)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-        any_crypto = False
-        for sym in self._symbols:
-            info = fresh.get(sym)
-            if not info:
-                self._set_text(sym, self.COL_TIME, "—")
-                continue
-            self._last[sym] = info
-            if info.get("is_crypto"):
-                any_crypto = True
-
-            self._set_text(sym, self.COL_PRICE, self._fmt_price(info.get("price")))
-            self._paint_change(sym, info.get("chg"), info.get("pct"))
-            self._set_text(sym, self.COL_HIGH, self._fmt_price(info.get("high")))
-            self._set_text(sym, self.COL_LOW,  self._fmt_price(info.get("low")))
-            self._set_text(sym, self.COL_VOL,  self._fmt_int(info.get("vol")))
-            basis = "since midnight" if info.get("chg_basis") == "since_local_midnight" else "vs prev close"
-            self._set_text(sym, self.COL_TIME, f"{info.get('tstr') or '—'} • {basis}")
-
-        labels = ["Symbol", "Price", "Change", "Change %", "High", "Low", "Volume", "Updated"]
-        if any_crypto:
-            labels[3] = "Change %*"
-        self._table.setHorizontalHeaderLabels(labels)
+    def _flush_prices(self):
+        pending, self._pending_prices = self._pending_prices, {}
+        self._merge_prices_ui(pending)
+
+    @QtCore.pyqtSlot(dict)
+    def _merge_prices_ui(self, fresh: Dict[str, Quote]):
+        if not fresh:
+            return
+        # Nobody listens to the view's own signals during a bulk merge
+        with self._table_batch(), QtCore.QSignalBlocker(self._table):
+            self._sync_rows_to_symbols()
+            for sym in self._symbols:
+                info = fresh.get(sym)
+                if info:
+                    self._last[sym] = info
+            # One bulk update -> one dataChanged for the whole table; rows the
+            # filter hides are only stored and get formatted when next shown
+            self._model.update_quotes(fresh, self._visible_symbols())
+
+    def _visible_symbols(self) -> Optional[set]:
+        """Symbols currently accepted by the filter, or None when nothing is hidden."""
+        if not self._proxy.filterRegularExpression().pattern():
+            return None
+        rows = self._model.symbols()
+        return {
+            rows[self._proxy.mapToSource(self._proxy.index(r, 0)).row()]
+            for r in range(self._proxy.rowCount())
+        }
 
     # --- status label slots ---
     @QtCore.pyqtSlot(str)
@@ -377,92 +610,31 @@ class LivePriceTrackerModule(BaseModule):
     def _set_status(self, msg: str):
         self._status.setText(msg)
 
-    # ---------------- Rows & filtering ----------------
+    # ---------------- Rows ----------------
     def _sync_rows_to_symbols(self):
-        current = set(self._symbols)
-        for sym in list(self._row_for_sym.keys()):
-            if sym not in current:
-                row = self._row_for_sym.pop(sym)
-                self._table.removeRow(row)
-                self._reindex_rows()
-        for sym in self._symbols:
-            self._ensure_row(sym)
-        self._count.setText(f"{len(self._symbols)} symbols")
-        self._apply_filter(self._filter.text())
-
-    def _ensure_row(self, sym: str):
-        if sym in self._row_for_sym:
+        symbols = tuple(self._symbols)
+        if symbols == self._last_synced_symbols:
+            return  # steady-state refresh: rows already match
+        with self._table_batch():
+            self._model.set_symbols(self._symbols)
+            self._count.setText(f"{len(self._symbols)} symbols")
+        self._last_synced_symbols = symbols
+
+    @contextlib.contextmanager
+    def _table_batch(self):
+        """Suspend table repaints/sorting for a bulk change; repaint once at the end."""
+        if not self._table.updatesEnabled():
+            yield  # already inside a batch
             return
-        row = self._table.rowCount()
-        self._table.insertRow(row)
-        self._row_for_sym[sym] = row
-        for col in range(self._table.columnCount()):
-            it = QtWidgets.QTableWidgetItem("")
-            if col in (self.COL_PRICE, self.COL_CHG, self.COL_PCT, self.COL_HIGH, self.COL_LOW, self.COL_VOL):
-                it.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
-            else:
-                it.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-            f = it.font()
-            f.setPointSizeF(max(9.0, f.pointSizeF()))
-            it.setFont(f)
-            self._table.setItem(row, col, it)
-        sym_item = self._table.item(row, self.COL_SYMBOL)
-        f = sym_item.font()
-        f.setBold(True)
-        sym_item.setFont(f)
-        sym_item.setText(sym)
-
-    def _reindex_rows(self):
-        remap: Dict[str, int] = {}
-        for r in range(self._table.rowCount()):
-            it = self._table.item(r, self.COL_SYMBOL)
-            if it:
-                remap[it.text()] = r
-        self._row_for_sym = remap
-
-    def _row(self, sym: str) -> Optional[int]:
-        return self._row_for_sym.get(sym)
-
-    def _set_text(self, sym: str, col: int, txt: str):
-        row = self._row(sym)
-        if row is None:
-            return
-        it = self._table.item(row, col)
-        if it is None:
-            it = QtWidgets.QTableWidgetItem(txt)
-            self._table.setItem(row, col, it)
-        else:
-            it.setText(txt)
-
-    def _paint_change(self, sym: str, chg: Optional[float], pct: Optional[float]):
-        row = self._row(sym)
-        if row is None:
-            return
-        ch_it = self._table.item(row, self.COL_CHG)
-        pc_it = self._table.item(row, self.COL_PCT)
-
-        def paint(item: QtWidgets.QTableWidgetItem, val: Optional[float], suffix: str):
-            if val is None or (isinstance(val, float) and (math.isnan(val) or math.isinf(val))):
-                item.setText("—")
-                item.setForeground(QtGui.QBrush(QtGui.QColor("#c0c4cf")))
-                return
-            up = val >= 0
-            arrow = "▲" if up else "▼"
-            col = QtGui.QColor("#16a34a" if up else "#dc2626")
-            if suffix == "%":
-                item.setText(f"{arrow} {abs(val):,.2f}{suffix}")
-            else:
-                item.setText(f"{arrow} {abs(val):,.2f}")
-            item.setForeground(QtGui.QBrush(col))
-
-        paint(ch_it, chg, "")
-        paint(pc_it, pct, "%")
-
-    def _apply_filter(self, text: str):
-        q = (text or "").strip().upper()
-        for sym, row in self._row_for_sym.items():
-            show = (q in sym.upper()) if q else True
-            self._table.setRowHidden(row, not show)
+        sorting = self._table.isSortingEnabled()
+        self._table.setUpdatesEnabled(False)
+        self._table.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            self._table.setSortingEnabled(sorting)
+            self._table.setUpdatesEnabled(True)
+            self._table.viewport().update()
 
     # ---------------- Settings (these are what the error said were missing) ----------------
     def _load_settings(self):
@@ -473,24 +645,38 @@ class LivePriceTrackerModule(BaseModule):
         s = QtCore.QSettings(SETTINGS_SCOPE, SETTINGS_SCOPE)
         s.setValue(SET_REFRESH_SEC, self.refresh_sb.value())
 
-    # ---------------- Formatting helpers ----------------
+    # ---------------- Cache locations ----------------
     @staticmethod
-    def _fmt_price(v: Optional[float]) -> str:
-        if v is None:
-            return "—"
+    def _cache_dir() -> str:
+        base = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.CacheLocation)
+        os.makedirs(base, exist_ok=True)
+        return base
+
+    def _purge_http_cache(self):
+        """Drop expired HTTP cache entries at most every HTTP_CACHE_PURGE s (scheduler thread)."""
+        if not REQUESTS_CACHE_OK:
+            return
+        now = time.monotonic()
+        if self._last_purge is not None and now - self._last_purge < HTTP_CACHE_PURGE:
+            return
+        self._last_purge = now
         try:
-            return f"{v:,.2f}" if v >= 1 else f"{v:,.4f}"
+            self._session.cache.delete(expired=True)
         except Exception:
+            pass  # a locked or damaged cache file shouldn't fail the refresh
+
+    # ---------------- Formatting helpers ----------------
+    @staticmethod
+    def _fmt_price(v: Optional[float]) -> str:
+        if not isinstance(v, (int, float)) or math.isnan(v):
             return "—"
+        return f"{v:,.2f}" if v >= 1 else f"{v:,.4f}"
 
     @staticmethod
     def _fmt_int(v: Optional[int | float]) -> str:
-        if v is None:
-            return "—"
-        try:
-            return f"{int(v):,}"
-        except Exception:
+        if not isinstance(v, (int, float)) or math.isnan(v) or math.isinf(v):
             return "—"
+        return f"{int(v):,}"
 
     @staticmethod
     def _fmt_time(ts: Optional[int]) -> str:
@@ -502,4 +688,226 @@ class LivePriceTrackerModule(BaseModule):
             return "—"
 
 
+# ---- Helpers ----
+class RefreshTask(QtCore.QRunnable):
+    """One refresh on the tracker's scheduler pool; results are queued back to the UI thread."""
+
+    def __init__(self, owner: LivePriceTrackerModule, symbols: List[str]):
+        super().__init__()
+        self._owner = owner
+        self._symbols = symbols
+
+    def run(self):
+        owner = self._owner
+        prices = None
+        try:
+            prices = owner._fetch_prices_combo(self._symbols)
+            msg = f"Updated {len(prices)} symbols."
+        except Exception as e:
+            msg = f"Refresh error: {e}"
+        finally:
+            owner._purge_http_cache()
+            owner._inflight = False
+
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        try:
+            if prices is not None:
+                QtCore.QMetaObject.invokeMethod(owner, "_queue_prices", queued, QtCore.Q_ARG(dict, prices))
+            QtCore.QMetaObject.invokeMethod(owner, "_on_status", queued, QtCore.Q_ARG(str, msg))
+        except RuntimeError:
+            pass  # module widget was deleted mid-refresh
+
+
+class QuoteTableModel(QtCore.QAbstractTableModel):
+    """Quote rows for the tracker table; cell text is reformatted only when its value changes."""
+    HEADERS = ["Symbol", "Price", "Change", "Change %", "High", "Low", "Volume", "Updated"]
+
+    # Shared brushes/prefixes; data() is called per painted cell
+    _BRUSH_UP      = QtGui.QBrush(QtGui.QColor("#16a34a"))
+    _BRUSH_DOWN    = QtGui.QBrush(QtGui.QColor("#dc2626"))
+    _BRUSH_NEUTRAL = QtGui.QBrush(QtGui.QColor("#c0c4cf"))
+    _ARROW_UP   = "▲ "
+    _ARROW_DOWN = "▼ "
+    # Raw cell values for the proxy's sort; never formats a deferred row
+    SORT_ROLE = QtCore.Qt.ItemDataRole.UserRole
+    _PAINT_ROLES = (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.ForegroundRole)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[str] = []
+        self._data: Dict[str, Quote] = {}
+        self._text: Dict[str, List[str]] = {}  # sym -> formatted cell text per column
+        self._missing: set[str] = set()  # symbols absent from the latest refresh
+        self._deferred: Dict[str, Quote] = {}  # filtered-out rows, formatted on next data()
+        self._any_crypto = False
+
+        self._font = QtGui.QFont()
+        self._font.setPointSizeF(max(9.0, self._font.pointSizeF()))
+        self._bold = QtGui.QFont(self._font)
+        self._bold.setBold(True)
+
+        M = LivePriceTrackerModule
+        # (column, quote key, formatter) for the value cells
+        self._cells = (
+            (M.COL_PRICE, "price", M._fmt_price),
+            (M.COL_CHG,   "chg",   lambda v: self._fmt_change(v, "")),
+            (M.COL_PCT,   "pct",   lambda v: self._fmt_change(v, "%")),
+            (M.COL_HIGH,  "high",  M._fmt_price),
+            (M.COL_LOW,   "low",   M._fmt_price),
+            (M.COL_VOL,   "vol",   M._fmt_int),
+        )
+        self._sort_keys = {col: key for col, key, _ in self._cells}
+
+    # ---- model API ----
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation != QtCore.Qt.Orientation.Horizontal or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        if section == LivePriceTrackerModule.COL_PCT and self._any_crypto:
+            return "Change %*"
+        return self.HEADERS[section]
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        M = LivePriceTrackerModule
+        sym = self._rows[index.row()]
+        col = index.column()
+        if role == self.SORT_ROLE:
+            return self._sort_value(sym, col)
+        if col != M.COL_SYMBOL and role in self._PAINT_ROLES and sym in self._deferred:
+            # Row just became visible: catch up from the stored quote
+            self._apply_quote(sym, self._deferred.pop(sym))
+
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            if col == M.COL_SYMBOL:
+                return sym  # filter key; never touches the quote
+            texts = self._text.get(sym)
+            return texts[col] if texts else ""
+
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+            if col not in (M.COL_CHG, M.COL_PCT):
+                return None
+            info = self._data.get(sym)
+            if info is None:
+                return None
+            val = info.chg if col == M.COL_CHG else info.pct
+            if not self._is_finite(val):
+                return self._BRUSH_NEUTRAL
+            return self._BRUSH_UP if val >= 0 else self._BRUSH_DOWN
+
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+            if col in (M.COL_PRICE, M.COL_CHG, M.COL_PCT, M.COL_HIGH, M.COL_LOW, M.COL_VOL):
+                return QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+            return QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+
+        if role == QtCore.Qt.ItemDataRole.FontRole:
+            return self._bold if col == M.COL_SYMBOL else self._font
+
+        return None
+
+    # ---- updates ----
+    def symbols(self) -> List[str]:
+        return list(self._rows)
+
+    def set_symbols(self, symbols: List[str]):
+        if symbols == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = list(symbols)
+        keep = set(self._rows)
+        self._data = {s: v for s, v in self._data.items() if s in keep}
+        self._text = {s: v for s, v in self._text.items() if s in keep}
+        self._deferred = {s: v for s, v in self._deferred.items() if s in keep}
+        self._missing &= keep
+        self.endResetModel()
+
+    def update_quotes(self, fresh: Dict[str, Quote], visible: Optional[set] = None):
+        """Merge a refresh; rows outside `visible` (None = all) are stored, not formatted."""
+        M = LivePriceTrackerModule
+        first = last = None
+        for row, sym in enumerate(self._rows):
+            info = fresh.get(sym)
+            if info and visible is not None and sym not in visible:
+                self._deferred[sym] = info
+                continue
+            self._deferred.pop(sym, None)
+            if info:
+                changed = self._apply_quote(sym, info)
+            elif sym not in self._missing:
+                self._missing.add(sym)
+                self._row_text(sym)[M.COL_TIME] = "—"
+                changed = True
+            else:
+                changed = False
+            if changed:
+                first = row if first is None else first
+                last = row
+
+        any_crypto = any(info.is_crypto for info in fresh.values())
+        if any_crypto != self._any_crypto:
+            self._any_crypto = any_crypto
+            self.headerDataChanged.emit(QtCore.Qt.Orientation.Horizontal, 0, len(self.HEADERS) - 1)
+
+        if first is not None:
+            self.dataChanged.emit(
+                self.index(first, 1),
+                self.index(last, len(self.HEADERS) - 1),
+                [QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def _sort_value(self, sym: str, col: int):
+        M = LivePriceTrackerModule
+        if col == M.COL_SYMBOL:
+            return sym
+        info = self._deferred.get(sym) or self._data.get(sym)
+        if col == M.COL_TIME:
+            return info.tstr if info and info.tstr else ""
+        val = getattr(info, self._sort_keys[col]) if info else None
+        return float(val) if self._is_finite(val) else float("-inf")
+
+    def _row_text(self, sym: str) -> List[str]:
+        texts = self._text.get(sym)
+        if texts is None:
+            texts = self._text[sym] = [sym] + [""] * (len(self.HEADERS) - 1)
+        return texts
+
+    def _apply_quote(self, sym: str, info: Quote) -> bool:
+        was_missing = sym in self._missing
+        self._missing.discard(sym)
+        changed = self._format_row(self._row_text(sym), info, self._data.get(sym), force_time=was_missing)
+        self._data[sym] = info
+        return changed
+
+    def _format_row(self, texts: List[str], info: Quote, prev: Optional[Quote], force_time: bool = False) -> bool:
+        """Refresh only the cells whose underlying value differs from `prev`."""
+        M = LivePriceTrackerModule
+        changed = False
+        for col, key, fmt in self._cells:
+            val = getattr(info, key)
+            if prev is None or getattr(prev, key) != val:
+                texts[col] = fmt(val)
+                changed = True
+        if force_time or prev is None or prev.tstr != info.tstr or prev.is_crypto != info.is_crypto:
+            basis = "since midnight" if info.is_crypto else "vs prev close"
+            texts[M.COL_TIME] = f"{info.tstr or '—'} • {basis}"
+            changed = True
+        return changed
+
+    @staticmethod
+    def _is_finite(val) -> bool:
+        return val is not None and not (isinstance(val, float) and (math.isnan(val) or math.isinf(val)))
+
+    def _fmt_change(self, val: Optional[float], suffix: str) -> str:
+        if not self._is_finite(val):
+            return "—"
+        arrow = self._ARROW_UP if val >= 0 else self._ARROW_DOWN
+        return f"{arrow}{abs(val):,.2f}{suffix}"
+
+
 MODULE_CLASS = LivePriceTrackerModule
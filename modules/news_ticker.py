@@ -1,7 +1,14 @@
+import bisect
+import json
+import math
 import re
 import time
-import threading
+from io import BytesIO
+from collections import deque
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 
 from PyQt6 import QtCore, QtGui, QtWidgets
@@ -12,6 +19,18 @@ try:
 except Exception:
     FEEDPARSER_OK = False
 
+try:
+    from lxml import etree as _lxml_etree  # optional, faster XML fallback
+    LXML_OK = True
+except Exception:
+    LXML_OK = False
+
+try:
+    import hyperscan  # optional, multi-pattern prefilter for large headline batches
+    HYPERSCAN_OK = True
+except Exception:
+    HYPERSCAN_OK = False
+
 from plugin_api import BaseModule
 
 YA_USER_AGENT = (
@@ -24,6 +43,22 @@ SETTINGS_SCOPE   = "StockTool/NewsTicker"
 SET_FEEDS        = "feeds"
 SET_SPEED        = "speed"
 SET_REFRESH_SEC  = "refresh_seconds"
+SET_FEED_META    = "feed_meta"
+
+MAX_SEGMENTS = 200  # headlines kept in the marquee
+MAX_FEED_ITEMS = 60  # entries taken from each feed
+SEG_CACHE_MAX = 2 * MAX_SEGMENTS  # formatted segments memoised by content + quote
+HS_BATCH_MIN = 500  # headlines per refresh before the hyperscan prefilter pays off
+
+MARQUEE_MAX_FPS = 60   # cap even on 120/144/240 Hz panels
+BASE_TICK_MS    = 16   # speed slider is in px per 16 ms
+
+FEED_TTL  = 60  # seconds a parsed feed is reused before revalidating with the server
+PRICE_TTL = 20  # seconds a symbol's quote is reused before refetching
+
+# Feed and quote fetches are I/O-bound; one shared pool serves every refresh
+IO_WORKERS = 8
+_IO_POOL = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="news-io")
 
 class NewsTickerModule(BaseModule):
     MODULE_ID   = "news_ticker"
@@ -39,13 +74,17 @@ class NewsTickerModule(BaseModule):
         self._running = False
 
         # Data/state (UI-thread)
-        self._items: List[dict] = []
+        # Marquee contents, oldest first; keys leave _seen_keys as their segment rolls off
+        self._segments: deque[Tuple[Tuple[str,str,str], str]] = deque(maxlen=MAX_SEGMENTS)
         self._seen_keys: set[Tuple[str,str,str]] = set()   # (title, link, sym)
-        self._prices: Dict[str, dict] = {}
-        self._price_cache_ts: float = 0.0
+        self._seg_cache: Dict[tuple, str] = {}  # insertion-ordered LRU of segment HTML
+        self._current_html = ""  # joined _segments, exactly as handed to the marquee
+        self._prices: Dict[str, Tuple[float, Optional[dict]]] = {}  # sym -> (fetched_ts, info or None if not returned)
+        # url -> {"etag", "last_modified", "items": [(title, link)], "ts"}; written from the feed pool
+        self._feed_meta: Dict[str, dict] = {}
 
         # Marquee state
-        self._x_offset = 0
+        self._x_offset = 0.0
         self._hover_pause = False
         self._sep_html = " &nbsp;&nbsp;<span style='color:#3b4154'>•</span>&nbsp;&nbsp; "
 
@@ -57,13 +96,37 @@ class NewsTickerModule(BaseModule):
             "https://www.cnbc.com/id/100003114/device/rss/rss.html",
         ]
 
+        # Shared keep-alive session; used from the feed pool and refresh threads
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": YA_USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, allowed_methods=["GET"]),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
         self._build_ui()
         self._load_settings()
 
         # Timers
+        # Settings are written 1 s after the user stops editing, not on every refresh
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(1000)
+        self._save_timer.timeout.connect(self._save_settings)
+        # No-arg wrapper: an int from valueChanged would pick QTimer.start(msec) and reset the interval
+        restart_save = lambda *_: self._save_timer.start()
+        self.feeds_edit.textChanged.connect(restart_save)
+        self.speed_slider.valueChanged.connect(restart_save)
+        self.refresh_every_sb.valueChanged.connect(restart_save)
+
         self._scroll_timer = QtCore.QTimer(self)
+        self._scroll_timer.setInterval(BASE_TICK_MS)  # re-derived from the screen on show
         self._scroll_timer.timeout.connect(self._tick_scroll)
-        self._scroll_timer.start(16)  # ~60fps
+        self._screen_hooked = False
+        # Started by _update_scroll_timer once the ticker is enabled, shown and not hovered
 
         self._refresh_timer = QtCore.QTimer(self)
         self._refresh_timer.timeout.connect(self.refresh_now)
@@ -73,6 +136,15 @@ class NewsTickerModule(BaseModule):
         self.itemsSig.connect(self._merge_items_ui)
         self.statusSig.connect(self._set_status)
 
+        # Dedicated single-thread Qt pool runs refreshes; overlapping requests are dropped, not
+        # stacked. Its destructor waits for a running refresh, so deleting the widget is safe.
+        self._scheduler = QtCore.QThreadPool(self)
+        self._scheduler.setMaxThreadCount(1)
+        self._refresh_inflight = False
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._save_settings)  # feed validators only change during refreshes
+
         # First prime
         QtCore.QTimer.singleShot(150, self.refresh_now)
 
@@ -135,13 +207,11 @@ class NewsTickerModule(BaseModule):
         lay.setContentsMargins(0, 0, 0, 0)
         lay.setSpacing(0)
 
-        self.ticker_label = QtWidgets.QLabel("")
-        self.ticker_label.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.LinksAccessibleByMouse)
-        self.ticker_label.setOpenExternalLinks(True)
-        self.ticker_label.setStyleSheet('QLabel{font:14px "Inter","Segoe UI",Arial;color:#f5f7fa;}')
+        # Headlines are laid out once per merge and blitted from cached pixmaps each frame
+        self.marquee = MarqueePainter(self.ticker_container)
 
         lay.addSpacing(16)
-        lay.addWidget(self.ticker_label)
+        lay.addWidget(self.marquee, 1)
         lay.addSpacing(16)
         self.scroll_area.setWidget(self.ticker_container)
 
@@ -174,11 +244,28 @@ class NewsTickerModule(BaseModule):
     # ---------------- BaseModule ----------------
     def on_enable(self):
         self._running = True
+        self._update_scroll_timer()
 
     def on_disable(self):
         self._running = False
+        self._update_scroll_timer()
+        self._scheduler.clear()
+        self._save_settings()
+
+    def showEvent(self, e: QtGui.QShowEvent):
+        super().showEvent(e)
+        handle = self.window().windowHandle()
+        if handle is not None and not self._screen_hooked:
+            handle.screenChanged.connect(lambda _s: self._set_tick_interval())
+            self._screen_hooked = True
+        self._set_tick_interval()
+        self._update_scroll_timer()
 
-    def on_data(self, data_by_symbol: Dict[str, List[dict]], tickers: List[str]):
+    def hideEvent(self, e: QtGui.QHideEvent):
+        super().hideEvent(e)
+        self._update_scroll_timer()
+
+    def on_data_arrays(self, arrays_by_symbol: Dict[str, dict], tickers: List[str]):
         # Keeping this hook in case you later want to limit by current chart symbols.
         pass
 
@@ -186,22 +273,38 @@ class NewsTickerModule(BaseModule):
     def _on_hover(self, entering: bool):
         def _fn():
             self._hover_pause = entering
+            self._update_scroll_timer()
         return _fn
 
+    def _set_tick_interval(self):
+        """Tick at the display's refresh rate, capped at MARQUEE_MAX_FPS."""
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0.0
+        fps = min(rate if rate > 0 else MARQUEE_MAX_FPS, MARQUEE_MAX_FPS)
+        self._scroll_timer.setInterval(max(8, int(1000 / fps)))
+
+    def _update_scroll_timer(self):
+        """Only tick while something would actually move on screen."""
+        want = self._running and not self._hover_pause and self.isVisible()
+        if want and not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+        elif not want and self._scroll_timer.isActive():
+            self._scroll_timer.stop()
+
     def _tick_scroll(self):
         if not self._running or self._hover_pause:
             return
-        px = self.speed_slider.value()
+        # Scale so on-screen speed doesn't depend on the tick interval
+        px = self.speed_slider.value() * self._scroll_timer.interval() / BASE_TICK_MS
         self._x_offset -= px
 
-        view_w = self.scroll_area.viewport().width()
-        text_w = self.ticker_label.sizeHint().width()
+        view_w = self.marquee.width()
+        text_w = self.marquee.text_width()
 
         if -self._x_offset > text_w + 96:
             self._x_offset = view_w
 
-        self.ticker_label.move(self._x_offset, 0)
-        self.ticker_container.setMinimumHeight(self.ticker_label.sizeHint().height() + 12)
+        self.marquee.set_offset(round(self._x_offset))
 
     def _reset_refresh_interval(self):
         self._refresh_timer.stop()
@@ -211,24 +314,29 @@ class NewsTickerModule(BaseModule):
     def refresh_now(self):
         if not self._running:
             return
-        self._save_settings()
-        t = threading.Thread(target=self._refresh_worker, daemon=True)
-        t.start()
+        if self._refresh_inflight:
+            return
+        feeds = [ln.strip() for ln in self.feeds_edit.toPlainText().splitlines() if ln.strip()]
+        if not feeds:
+            self._set_status("No feeds configured.")
+            return
+        self._refresh_inflight = True
+        self._scheduler.start(RefreshTask(self, feeds))
 
-    def _refresh_worker(self):
-        try:
-            feeds = [ln.strip() for ln in self.feeds_edit.toPlainText().splitlines() if ln.strip()]
-            if not feeds:
-                self.statusSig.emit("No feeds configured.")
-                return
+    @QtCore.pyqtSlot()
+    def _on_refresh_done(self):
+        self._refresh_inflight = False
 
+    def _refresh_worker(self, feeds: List[str]):
+        # Runs on the scheduler pool thread (RefreshTask)
+        try:
             articles = []
-            for url in feeds:
+            futs = {_IO_POOL.submit(self._fetch_feed, url): url for url in feeds}
+            for fut in as_completed(futs):
                 try:
-                    items = self._fetch_feed(url)
-                    articles.extend(items)
+                    articles.extend(fut.result())
                 except Exception as e:
-                    self.statusSig.emit(f"Feed error: {url} ({e})")
+                    self.statusSig.emit(f"Feed error: {futs[fut]} ({e})")
 
             # Deduplicate by (title, link)
             seen = set()
@@ -242,20 +350,15 @@ class NewsTickerModule(BaseModule):
 
             enriched = self._attach_symbols(unique)
 
-            # Price refresh (short cache)
-            now = time.time()
+            # Price refresh (per-symbol TTL; only stale symbols hit Yahoo)
             symbols = sorted({it["symbol"] for it in enriched if it.get("symbol")})
-            if symbols and (now - self._price_cache_ts > 15):
-                got = self._yahoo_prices(symbols)
-                if got:
-                    self._prices.update(got)
-                    self._price_cache_ts = now
+            prices = self._yahoo_prices(symbols)
 
             # Merge price data into enriched
             for it in enriched:
                 sym = it.get("symbol") or ""
-                if sym and sym in self._prices:
-                    it.update(self._prices[sym])
+                if sym and sym in prices:
+                    it.update(prices[sym])
 
             # Incremental merge (no wipe)
             self.itemsSig.emit(enriched)
@@ -264,100 +367,215 @@ class NewsTickerModule(BaseModule):
             self.statusSig.emit(f"Refresh error: {e}")
 
     def _fetch_feed(self, url: str) -> List[dict]:
-        out = []
+        meta = self._feed_meta.get(url) or {}
+        cached = meta.get("items")
+        if cached is not None and time.time() - meta.get("ts", 0) < FEED_TTL:
+            return self._cached_items(cached)
+
+        # Every feed goes through the pooled session (conditional GET), then gets parsed
+        headers = {}
+        if cached is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        resp = self._session.get(url, headers=headers, timeout=12)
+        if resp.status_code == 304 and cached is not None:
+            self._feed_meta[url] = dict(meta, ts=time.time())
+            return self._cached_items(cached)
+        resp.raise_for_status()
+
         if FEEDPARSER_OK:
-            d = feedparser.parse(url)
-            for e in d.entries[:60]:
+            out = []
+            d = feedparser.parse(resp.content)
+            for e in d.entries[:MAX_FEED_ITEMS]:
                 title = getattr(e, "title", "").strip()
                 link  = getattr(e, "link", "").strip()
                 if title:
                     out.append({"title": title, "link": link})
+        else:
+            # Fallback: simple XML
+            out = self._parse_rss_items(resp.content)
+        self._store_feed_meta(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), out)
+        return out
+
+    @staticmethod
+    def _parse_rss_items(content: bytes) -> List[dict]:
+        out = []
+        if LXML_OK:
+            # Stream <item>s and stop after MAX_FEED_ITEMS instead of building the whole tree
+            for _, item in _lxml_etree.iterparse(BytesIO(content), events=("end",), tag="item"):
+                t = (item.findtext("title") or "").strip()
+                l = (item.findtext("link") or "").strip()
+                item.clear()
+                if t:
+                    out.append({"title": t, "link": l})
+                    if len(out) >= MAX_FEED_ITEMS:
+                        break
             return out
 
-        # Fallback: simple XML
         import xml.etree.ElementTree as ET
-        resp = requests.get(url, headers={"User-Agent": YA_USER_AGENT}, timeout=12)
-        resp.raise_for_status()
-        root = ET.fromstring(resp.content)
+        root = ET.fromstring(content)
         for item in root.findall(".//item"):
             t = (item.findtext("title") or "").strip()
             l = (item.findtext("link") or "").strip()
             if t:
                 out.append({"title": t, "link": l})
+                if len(out) >= MAX_FEED_ITEMS:
+                    break
         return out
 
+    @staticmethod
+    def _cached_items(cached: List[Tuple[str, str]]) -> List[dict]:
+        # Fresh dicts each time: the refresh path enriches its items in place
+        return [{"title": t, "link": l} for t, l in cached]
+
+    def _store_feed_meta(self, url: str, etag: Optional[str], modified: Optional[str], entries: List[dict]):
+        self._feed_meta[url] = {
+            "etag": etag,
+            "last_modified": modified,
+            "items": [(e["title"], e["link"]) for e in entries],
+            "ts": time.time(),
+        }
+
     # ---------------- Symbol detection (always on) ----------------
-    _SYM_PATTERNS = [
-        re.compile(r"\$([A-Z]{1,5})(?![A-Za-z])"),                # $TSLA
-        re.compile(r"\(([A-Z]{1,5})\)"),                          # (AAPL)
-        re.compile(r"\b(?:NASDAQ|NYSE|AMEX|LSE|TSX)[:\s\-]+([A-Z]{1,5})\b"),
-        re.compile(r"\b([A-Z]{1,5})\b"),                          # fallback caps
-    ]
-    _STOPWORDS = {
+    # One left-to-right pass; alternatives are listed in priority order
+    _SYM_COMBINED = re.compile(
+        r"\$(?P<dollar>[A-Z]{1,5})(?![A-Za-z])"                     # $TSLA
+        r"|\((?P<paren>[A-Z]{1,5})\)"                               # (AAPL)
+        r"|\b(?:NASDAQ|NYSE|AMEX|LSE|TSX)[:\s\-]+(?P<exch>[A-Z]{1,5})\b"
+        r"|\b(?P<caps>[A-Z]{1,5})\b"                                # fallback caps
+    )
+    _SYM_PRIORITY = {"dollar": 0, "paren": 1, "exch": 2, "caps": 3}
+    _SYM_CAPS = re.compile(r"\b([A-Z]{1,5})\b")
+    # Lookahead-free supersets of the three high-precision alternatives
+    _HS_PATTERNS = (
+        rb"\$[A-Z]",
+        rb"\([A-Z]{1,5}\)",
+        rb"\b(?:NASDAQ|NYSE|AMEX|LSE|TSX)[:\s\-]+[A-Z]{1,5}\b",
+    )
+    _hs_db = None
+    _STOPWORDS = frozenset({
         "THE","AND","FOR","WITH","FROM","THIS","WALL","STREET","CNBC","MARKET","NEWS",
         "FED","ECB","BOE","OPEC","GDP","CPI","PPI","EPS","ETF","IPO","AI","USA","US",
         "MORE","LIVE","DAILY","TODAY","BREAKING","UPDATE","UPDATES","TOP","OF","IN"
-    }
+    })
 
     def _guess_symbol(self, title: str) -> Optional[str]:
-        for pat in self._SYM_PATTERNS[:3]:
-            m = pat.search(title)
-            if m:
-                return m.group(1).upper()
-        # all-caps fallback always enabled
-        words = re.findall(self._SYM_PATTERNS[3], title)
-        words = [w for w in words if w.upper() not in self._STOPWORDS]
-        return words[0].upper() if words else None
+        best: Optional[str] = None
+        best_rank = len(self._SYM_PRIORITY)
+        for m in self._SYM_COMBINED.finditer(title):
+            kind = m.lastgroup
+            rank = self._SYM_PRIORITY[kind]
+            if rank >= best_rank:
+                continue
+            word = m.group(kind)  # every group is [A-Z]{1,5}: already upper-case
+            # all-caps fallback always enabled
+            if kind == "caps" and word in self._STOPWORDS:
+                continue
+            if rank == 0:
+                return word
+            best, best_rank = word, rank
+        return best
+
+    def _guess_caps(self, title: str) -> Optional[str]:
+        """Caps fallback only, for titles known to have no high-precision match."""
+        for m in self._SYM_CAPS.finditer(title):
+            if m.group(1) not in self._STOPWORDS:
+                return m.group(1)
+        return None
 
     def _attach_symbols(self, items: List[dict]) -> List[dict]:
-        out = []
+        # In place: the list and its dicts are built fresh by each refresh
+        if HYPERSCAN_OK and len(items) >= HS_BATCH_MIN:
+            titles = [it.get("title","") for it in items]
+            hits = self._hs_candidates(titles)
+            for i, it in enumerate(items):
+                it["symbol"] = self._guess_symbol(titles[i]) if i in hits else self._guess_caps(titles[i])
+            return items
         for it in items:
-            title = it.get("title","")
-            sym = self._guess_symbol(title)
-            n = dict(it)
-            n["symbol"] = sym
-            out.append(n)
-        return out
+            it["symbol"] = self._guess_symbol(it.get("title",""))
+        return items
+
+    @classmethod
+    def _hs_candidates(cls, titles: List[str]) -> set:
+        """Indexes of titles with a possible $/( )/exchange symbol, from one scan of the batch."""
+        if cls._hs_db is None:
+            db = hyperscan.Database()
+            db.compile(expressions=list(cls._HS_PATTERNS), ids=list(range(len(cls._HS_PATTERNS))))
+            cls._hs_db = db
+
+        encoded = [t.encode("utf-8") for t in titles]
+        starts, pos = [], 0
+        for b in encoded:
+            starts.append(pos)
+            pos += len(b) + 1  # "\n" separator
+        hits: set = set()
+
+        # Attributed by end offset; a hit spilling over a separator only costs the full regex
+        def on_match(_id, _start, end, _flags, _ctx):
+            hits.add(bisect.bisect_right(starts, end - 1) - 1)
+
+        cls._hs_db.scan(b"\n".join(encoded), match_event_handler=on_match)
+        return hits
 
     # ---------------- Prices ----------------
     def _yahoo_prices(self, symbols: List[str]) -> Dict[str, dict]:
-        out: Dict[str, dict] = {}
+        """Quotes for `symbols`, refetching only those missing or older than PRICE_TTL."""
         if not symbols:
-            return out
-        headers = {"User-Agent": YA_USER_AGENT, "Accept": "application/json"}
+            return {}
+        now = time.time()
+        stale = [s for s in symbols if now - self._prices.get(s, (0.0,))[0] > PRICE_TTL]
+
+        out: Dict[str, dict] = {}
         chunk = 45
-        for i in range(0, len(symbols), chunk):
-            group = symbols[i:i+chunk]
-            url = YA_QUOTE_URL.format(symbols=",".join(group))
-            try:
-                r = requests.get(url, headers=headers, timeout=12)
-                r.raise_for_status()
-                data = r.json()
-                results = (data.get("quoteResponse", {}) or {}).get("result", []) or []
-                for q in results:
-                    sym = (q.get("symbol") or "").upper()
-                    price = q.get("regularMarketPrice")
-                    opn   = q.get("regularMarketOpen")
-                    chg   = q.get("regularMarketChange")
-                    chgPct= q.get("regularMarketChangePercent")
-                    curr  = q.get("currency") or ""
-                    if not sym or price is None or opn is None:
-                        continue
-                    if chg is None:
-                        chg = float(price) - float(opn)
-                    if chgPct is None and opn:
-                        chgPct = (float(price)-float(opn)) / float(opn) * 100.0
-                    up = float(chg) >= 0
-                    out[sym] = {
-                        "price": float(price),
-                        "open": float(opn),
-                        "up": bool(up),
-                        "chg": float(chg),
-                        "chgPct": float(chgPct if chgPct is not None else 0.0),
-                        "currency": curr
-                    }
-            except Exception:
-                pass
+        futs = [_IO_POOL.submit(self._fetch_one_chunk, stale[i:i+chunk]) for i in range(0, len(stale), chunk)]
+        for fut in as_completed(futs):
+            out.update(fut.result())
+
+        for sym in stale:
+            info = out.get(sym)
+            if info is None:
+                # Not in the response (delisted, false-positive detection, failed chunk): remember
+                # the attempt so it waits out PRICE_TTL too; keep any earlier quote for display
+                prev = self._prices.get(sym)
+                info = prev[1] if prev else None
+            self._prices[sym] = (now, info)
+        return {s: self._prices[s][1] for s in symbols if self._prices.get(s, (0.0, None))[1] is not None}
+
+    def _fetch_one_chunk(self, group: List[str]) -> Dict[str, dict]:
+        out: Dict[str, dict] = {}
+        headers = {"Accept": "application/json"}
+        url = YA_QUOTE_URL.format(symbols=",".join(group))
+        try:
+            r = self._session.get(url, headers=headers, timeout=12)
+            r.raise_for_status()
+            data = r.json()
+            results = (data.get("quoteResponse", {}) or {}).get("result", []) or []
+            for q in results:
+                sym = (q.get("symbol") or "").upper()
+                price = q.get("regularMarketPrice")
+                opn   = q.get("regularMarketOpen")
+                chg   = q.get("regularMarketChange")
+                chgPct= q.get("regularMarketChangePercent")
+                curr  = q.get("currency") or ""
+                if not sym or price is None or opn is None:
+                    continue
+                if chg is None:
+                    chg = float(price) - float(opn)
+                if chgPct is None and opn:
+                    chgPct = (float(price)-float(opn)) / float(opn) * 100.0
+                up = float(chg) >= 0
+                out[sym] = {
+                    "price": float(price),
+                    "open": float(opn),
+                    "up": bool(up),
+                    "chg": float(chg),
+                    "chgPct": float(chgPct if chgPct is not None else 0.0),
+                    "currency": curr
+                }
+        except Exception:
+            pass
         return out
 
     # ---------------- UI merge (no wipe) ----------------
@@ -366,7 +584,8 @@ class NewsTickerModule(BaseModule):
         if not fresh:
             return
 
-        new_segments: List[str] = []
+        added: List[str] = []
+        evicted = False
         for it in fresh:
             title = it.get("title","").strip()
             link  = it.get("link","").strip()
@@ -375,29 +594,52 @@ class NewsTickerModule(BaseModule):
             if key in self._seen_keys:
                 continue
 
-            self._seen_keys.add(key)
-            self._items.append(it)
             seg = self._segment_html(it)
-            if seg:
-                new_segments.append(seg)
+            if not seg:
+                continue
+            if len(self._segments) == self._segments.maxlen:
+                self._seen_keys.discard(self._segments[0][0])
+                evicted = True
+            self._seen_keys.add(key)
+            self._segments.append((key, seg))
+            added.append(seg)
 
-        if not new_segments:
+        if not added:
             return
 
-        current_html = self.ticker_label.text().strip()
-        add_html = self._sep_html.join(new_segments)
-        new = (current_html + self._sep_html + add_html) if current_html else add_html
+        # Append to the authoritative string; rejoin only when old segments rolled off
+        if evicted or not self._current_html:
+            self._current_html = self._sep_html.join(seg for _, seg in self._segments)
+        else:
+            self._current_html += self._sep_html + self._sep_html.join(added)
 
         # Preserve marquee offset
-        self.ticker_label.setText(new)
+        self.marquee.set_html(self._current_html)
+        min_h = self.marquee.text_height() + 12
+        if min_h != self.ticker_container.minimumHeight():
+            self.ticker_container.setMinimumHeight(min_h)
         self._position_fades()
 
     def _segment_html(self, it: dict) -> str:
         title = it.get("title","").strip()
         link  = it.get("link","").strip()
         sym   = (it.get("symbol") or "").strip()
-        pinfo = self._prices.get(sym) if sym else None
+        cached = self._prices.get(sym) if sym else None
+        pinfo = cached[1] if cached else None
 
+        # A quote change alters the key, so stale variants just age out of the LRU
+        key = (title, link, sym) + (
+            (pinfo.get("price"), pinfo.get("chgPct"), pinfo.get("up")) if pinfo else ()
+        )
+        seg = self._seg_cache.pop(key, None)
+        if seg is None:
+            seg = self._build_segment(title, link, sym, pinfo)
+            if len(self._seg_cache) >= SEG_CACHE_MAX:
+                del self._seg_cache[next(iter(self._seg_cache))]
+        self._seg_cache[key] = seg
+        return seg
+
+    def _build_segment(self, title: str, link: str, sym: str, pinfo: Optional[dict]) -> str:
         sym_html = f"<span style='color:#86c5ff;font-weight:600'>[{sym}]</span> " if sym else ""
         title_esc = self._escape(title)
         title_html = (
@@ -433,28 +675,54 @@ class NewsTickerModule(BaseModule):
         # Speed defaults to LOWEST always (1) unless user previously set something
         self.speed_slider.setValue(s.value(SET_SPEED, 1, type=int))
         self.refresh_every_sb.setValue(s.value(SET_REFRESH_SEC, self.refresh_every_sb.value(), type=int))
+        try:
+            meta = json.loads(s.value(SET_FEED_META, "", type=str) or "{}")
+            self._feed_meta = meta if isinstance(meta, dict) else {}
+        except Exception:
+            self._feed_meta = {}
 
     def _save_settings(self):
         s = QtCore.QSettings(SETTINGS_SCOPE, SETTINGS_SCOPE)
         s.setValue(SET_FEEDS, self.feeds_edit.toPlainText())
         s.setValue(SET_SPEED, self.speed_slider.value())
         s.setValue(SET_REFRESH_SEC, self.refresh_every_sb.value())
+        # Validators + last entries, so a restart can revalidate instead of refetching
+        s.setValue(SET_FEED_META, json.dumps(dict(self._feed_meta)))
 
     # ---------------- Utils ----------------
+    # Single-pass entity tables for str.translate
+    _TEXT_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+    _ATTR_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"})
+
     @staticmethod
     def _escape(s: str) -> str:
-        return s.replace("&","&amp;").replace("<","&lt;").replace(">","&gt;")
+        return s.translate(NewsTickerModule._TEXT_TABLE)
 
     @staticmethod
     def _escape_attr(s: str) -> str:
-        return (s.replace("&","&amp;")
-                 .replace("<","&lt;")
-                 .replace(">","&gt;")
-                 .replace('"',"&quot;")
-                 .replace("'","&#39;"))
+        return s.translate(NewsTickerModule._ATTR_TABLE)
 
 
 # ---- Helpers ----
+class RefreshTask(QtCore.QRunnable):
+    """One refresh on the ticker's scheduler pool; completion is queued back to the UI thread."""
+
+    def __init__(self, owner: "NewsTickerModule", feeds: List[str]):
+        super().__init__()
+        self._owner = owner
+        self._feeds = feeds
+
+    def run(self):
+        owner = self._owner
+        try:
+            owner._refresh_worker(self._feeds)
+        except RuntimeError:
+            return  # module widget was deleted mid-refresh
+        try:
+            QtCore.QMetaObject.invokeMethod(owner, "_on_refresh_done", QtCore.Qt.ConnectionType.QueuedConnection)
+        except RuntimeError:
+            pass
+
 class HoverPauseWidget(QtWidgets.QWidget):
     entered = QtCore.pyqtSignal()
     exited  = QtCore.pyqtSignal()
@@ -465,6 +733,125 @@ class HoverPauseWidget(QtWidgets.QWidget):
         self.exited.emit()
         super().leaveEvent(e)
 
+class MarqueePainter(QtWidgets.QWidget):
+    """Horizontal rich-text strip: laid out once per set_html(), drawn as cached pixmap tiles."""
+    TILE_W = 4096  # stays well under the platform pixmap size limit
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._x = 0
+        self._text_w = self._text_h = 0  # measured once per set_html()
+        self._tiles: List[Tuple[int, QtGui.QPixmap]] = []  # (doc x, tile)
+        self._doc = QtGui.QTextDocument(self)
+        self._doc.setDocumentMargin(0)
+        font = QtGui.QFont()
+        font.setFamilies(["Inter", "Segoe UI", "Arial"])
+        font.setPixelSize(14)
+        self._doc.setDefaultFont(font)
+        self._color = QtGui.QColor("#f5f7fa")
+        self.setMouseTracking(True)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
+
+    def text_width(self) -> int:
+        return self._text_w
+
+    def text_height(self) -> int:
+        return self._text_h
+
+    def sizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(self.text_width(), self.text_height())
+
+    def set_html(self, html: str):
+        self._doc.setHtml(html)
+        self._doc.setTextWidth(-1)  # single line, no wrapping
+        self._text_w = math.ceil(self._doc.idealWidth())
+        self._text_h = math.ceil(self._doc.size().height())
+        self._render_tiles()
+        self.updateGeometry()
+        self.update()
+
+    def set_offset(self, x: int):
+        if x != self._x:
+            self._x = x
+            self.update()
+
+    def _render_tiles(self):
+        self._tiles = []
+        w, h = self.text_width(), self.text_height()
+        if w <= 0 or h <= 0:
+            return
+        dpr = self.devicePixelRatioF()
+        ctx = QtGui.QAbstractTextDocumentLayout.PaintContext()
+        ctx.palette.setColor(QtGui.QPalette.ColorRole.Text, self._color)
+        layout = self._doc.documentLayout()
+        for x0 in range(0, w, self.TILE_W):
+            tw = min(self.TILE_W, w - x0)
+            pix = QtGui.QPixmap(math.ceil(tw * dpr), math.ceil(h * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(QtCore.Qt.GlobalColor.transparent)
+            p = QtGui.QPainter(pix)
+            p.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing, True)
+            p.translate(-x0, 0)
+            ctx.clip = QtCore.QRectF(x0, 0, tw, h)
+            layout.draw(p, ctx)
+            p.end()
+            self._tiles.append((x0, pix))
+
+    def paintEvent(self, ev: QtGui.QPaintEvent):
+        if not self._tiles:
+            return
+        p = QtGui.QPainter(self)
+        y = max(0, (self.height() - self.text_height()) // 2)
+        view_w = self.width()
+        for x0, pix in self._tiles:
+            x = self._x + x0
+            if x + self.TILE_W < 0 or x > view_w:
+                continue
+            p.drawPixmap(x, y, pix)
+        p.end()
+
+    # ---- links / tooltips ----
+    def _doc_point(self, pos: QtCore.QPointF) -> QtCore.QPointF:
+        y = max(0, (self.height() - self.text_height()) // 2)
+        return QtCore.QPointF(pos.x() - self._x, pos.y() - y)
+
+    def _anchor_at(self, pos: QtCore.QPointF) -> str:
+        return self._doc.documentLayout().anchorAt(self._doc_point(pos))
+
+    def _tooltip_at(self, pos: QtCore.QPointF) -> str:
+        """The title= text of the segment under pos (kept by Qt as the char format's toolTip)."""
+        hit = self._doc.documentLayout().hitTest(self._doc_point(pos), QtCore.Qt.HitTestAccuracy.ExactHit)
+        if hit < 0:
+            return ""
+        cur = QtGui.QTextCursor(self._doc)
+        cur.setPosition(hit + 1)  # charFormat() reports the character before the cursor
+        return cur.charFormat().toolTip()
+
+    def event(self, e: QtCore.QEvent) -> bool:
+        if e.type() == QtCore.QEvent.Type.ToolTip:
+            tip = self._tooltip_at(QtCore.QPointF(e.pos()))
+            if tip:
+                QtWidgets.QToolTip.showText(e.globalPos(), tip, self)
+            else:
+                QtWidgets.QToolTip.hideText()
+                e.ignore()
+            return True
+        return super().event(e)
+
+    def mouseMoveEvent(self, e: QtGui.QMouseEvent):
+        link = self._anchor_at(e.position())
+        shape = QtCore.Qt.CursorShape.PointingHandCursor if link else QtCore.Qt.CursorShape.ArrowCursor
+        self.setCursor(shape)
+        super().mouseMoveEvent(e)
+
+    def mouseReleaseEvent(self, e: QtGui.QMouseEvent):
+        if e.button() == QtCore.Qt.MouseButton.LeftButton:
+            link = self._anchor_at(e.position())
+            if link:
+                QtGui.QDesktopServices.openUrl(QtCore.QUrl(link))
+        super().mouseReleaseEvent(e)
+
+
 class GradientFade(QtWidgets.QWidget):
     def __init__(self, direction: str, parent=None):
         super().__init__(parent)
@@ -1,5 +1,6 @@
 from typing import List, Dict
-from PyQt6 import QtWidgets
+import numpy as np
+from PyQt6 import QtCore, QtWidgets
 from plugin_api import BaseModule
 
 class WinnerLoserModule(BaseModule):
@@ -29,36 +30,58 @@ class WinnerLoserModule(BaseModule):
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         outer.addWidget(self.table)
 
+    def on_data_arrays(self, arrays_by_symbol: Dict[str, Dict[str, np.ndarray]], tickers: List[str]):
+        # Columns arrive NaN-free from the fetch; no row conversion needed
+        self._fill({sym: a["close"] - a["open"] for sym, a in arrays_by_symbol.items()}, tickers)
+
     def on_data(self, data_by_symbol: Dict[str, List[dict]], tickers: List[str]):
+        diffs = {}
+        for sym, rows in data_by_symbol.items():
+            arr = np.array(
+                [(r["open"], r["close"]) for r in rows
+                 if r.get("open") is not None and r.get("close") is not None],
+                dtype=np.float64,
+            ).reshape(-1, 2)
+            diffs[sym] = arr[:, 1] - arr[:, 0]
+        self._fill(diffs, tickers)
+
+    def _fill(self, diffs: Dict[str, np.ndarray], tickers: List[str]):
+        """diffs: close - open per day, per symbol."""
         # Compute totals
         grand_total = grand_w = grand_l = grand_t = 0
 
-        # Fill per-asset
-        self.table.setRowCount(0)
-        for sym in tickers:
-            rows = data_by_symbol.get(sym, [])
+        # Fill per-asset in one batch; items are reused across calls
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        self.table.blockSignals(True)
+        self.table.setRowCount(len(tickers))
+        for row, sym in enumerate(tickers):
+            diff = diffs.get(sym)
             w = l = t = 0
-            for r in rows:
-                o, c = r.get("open"), r.get("close")
-                if o is None or c is None:
-                    continue
-                if c > o: w += 1
-                elif c < o: l += 1
-                else: t += 1
+            if diff is not None and diff.size:
+                w = int((diff > 0).sum())
+                l = int((diff < 0).sum())
+                t = len(diff) - w - l
             total = w + l + t
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(sym))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(total)))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(w)))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(l)))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(t)))
+            for col, val in enumerate((sym, total, w, l, t)):
+                self._set_cell(row, col, val)
 
             grand_total += total
             grand_w += w
             grand_l += l
             grand_t += t
 
+        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
+
         self.totals_line.setText(
             f"Totals — Total: {grand_total} | Winners: {grand_w} | Losers: {grand_l} | Unchanged: {grand_t}"
         )
+
+    def _set_cell(self, row: int, col: int, value):
+        item = self.table.item(row, col)
+        if item is None:
+            item = QtWidgets.QTableWidgetItem()
+            self.table.setItem(row, col, item)
+        # Ints stay ints so the column sorts numerically
+        item.setData(QtCore.Qt.ItemDataRole.DisplayRole, value)
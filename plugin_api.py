@@ -1,5 +1,16 @@
 from PyQt6 import QtWidgets
 from typing import Dict, List
+import numpy as np
+
+
+def arrays_to_rows(arrays: Dict[str, np.ndarray]) -> List[dict]:
+    """Column arrays {"ts", "open", "close"} -> [{"date": "YYYY-MM-DD", "open": ..., "close": ...}, ...]."""
+    dates = arrays["ts"].astype("datetime64[s]").astype("datetime64[D]").astype(str)
+    return [
+        {"date": d, "open": o, "close": c}
+        for d, o, c in zip(dates.tolist(), arrays["open"].tolist(), arrays["close"].tolist())
+    ]
+
 
 class BaseModule(QtWidgets.QWidget):
     """
@@ -9,14 +20,31 @@ class BaseModule(QtWidgets.QWidget):
     Optional hooks:
       on_enable(self)
       on_disable(self)
+      on_data_arrays(self, arrays_by_symbol: Dict[str, Dict[str, np.ndarray]], tickers: List[str])
+        - arrays_by_symbol: {"AAPL": {"ts": int64[], "open": float64[], "close": float64[]}, ...}
+          (ts is UNIX seconds, ascending). Default converts to rows and calls on_data.
       on_data(self, data_by_symbol: Dict[str, List[dict]], tickers: List[str])
         - data_by_symbol: {"AAPL": [{"date": "...", "open": ..., "close": ...}, ...], ...}
         - tickers: the ordered list of tickers the user requested (may be subset if some failed)
+
+    Numeric helpers over the column arrays (rolling_mean, pct_change, zscore_matrix) live in fast_ops.
     """
     MODULE_ID = "base"
     MODULE_NAME = "Base Module"
     MODULE_DESC = "Base module"
 
+    # Every subclass, in definition order; the loader picks a module's class from here
+    _registry: List[type] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        BaseModule._registry.append(cls)
+
     def on_enable(self): pass
     def on_disable(self): pass
     def on_data(self, data_by_symbol, tickers): pass
+
+    def on_data_arrays(self, arrays_by_symbol, tickers):
+        if type(self).on_data is BaseModule.on_data:
+            return  # nobody listens; skip the row conversion
+        self.on_data({sym: arrays_to_rows(a) for sym, a in arrays_by_symbol.items()}, tickers)
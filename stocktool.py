@@ -1,20 +1,32 @@
 import os
 import sys
 import json
+import sqlite3
+import threading
 import time
+import functools
+import contextlib
 import importlib.util
 import traceback
 import datetime as dt
 import urllib.parse
-import requests
-from typing import Dict, List, Tuple
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+try:
+    import orjson  # optional, faster decode of multi-MB chart payloads
+    ORJSON_OK = True
+except Exception:
+    ORJSON_OK = False
+
 APP_NAME = "StockTool"
 APP_VERSION = "1.2"
 SETTINGS_FILE = "settings.json"
+CACHE_DB = "cache.sqlite"
 MODULES_DIR = "modules"
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -27,6 +39,33 @@ from plugin_api import BaseModule  # shared plugin base
 YA_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome Safari"
 YA_BASE = ("https://query1.finance.yahoo.com/v8/finance/chart/"
            "{symbol}?period1={p1}&period2={p2}&interval=1d&includePrePost=false&events=history")
+FETCH_WORKERS = 8  # concurrent per-ticker requests
+IMPORT_WORKERS = 8  # concurrent module imports at startup
+
+# One keep-alive session for every Yahoo call; pool sized for FETCH_WORKERS.
+# Built on the first fetch so requests/urllib3 stay out of the startup path.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _session():
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:  # the first fetch batch hits this from several pool threads
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                session = requests.Session()
+                session.headers.update({"User-Agent": YA_USER_AGENT, "Accept": "application/json",
+                                        "Connection": "keep-alive"})
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=16,
+                    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                                      allowed_methods=["GET"]),
+                ))
+                _SESSION = session
+    return _SESSION
 
 # ---------------- pyqtgraph (fast, crash-proof plotting) ----------------
 import pyqtgraph as pg
@@ -74,21 +113,84 @@ QScrollBar:vertical, QScrollBar:horizontal {
 
 # ====================== Data fetch ======================
 
-def _fetch_single(ticker: str, days: int) -> List[dict]:
+# ---------------- Bar cache (SQLite) ----------------
+# Past daily bars never change, so only the tail of a window needs the network.
+# bars: one row per (symbol, ts); coverage: the [start, end] window already fetched.
+_DB_LOCAL = threading.local()
+
+def _db() -> sqlite3.Connection:
+    """Per-thread connection; WAL lets the fetch workers read while one writes."""
+    con = getattr(_DB_LOCAL, "con", None)
+    if con is None:
+        con = sqlite3.connect(CACHE_DB, timeout=10)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS bars("
+            "symbol TEXT, ts INTEGER, open REAL, close REAL, PRIMARY KEY(symbol, ts))"
+        )
+        con.execute("CREATE TABLE IF NOT EXISTS coverage(symbol TEXT PRIMARY KEY, start INTEGER, end INTEGER)")
+        con.commit()
+        _DB_LOCAL.con = con
+    return con
+
+
+def _fetch_single(ticker: str, days: int) -> Dict[str, np.ndarray]:
+    """Daily bars as column arrays: {"ts": int64 UNIX s, "open": float64, "close": float64}."""
     if not ticker or days <= 0:
         raise ValueError("Ticker and number of days must be positive.")
 
-    symbol = urllib.parse.quote(ticker.strip())
+    key = ticker.strip().upper()
     now = int(time.time())
     start_time = dt.datetime.now(dt.UTC) - dt.timedelta(days=days)
     start = int(start_time.timestamp())
 
-    url = YA_BASE.format(symbol=symbol, p1=start, p2=now)
-    headers = {"User-Agent": YA_USER_AGENT, "Accept": "application/json"}
+    con = _db()
+    cov = con.execute("SELECT start, end FROM coverage WHERE symbol=?", (key,)).fetchone()
+    if cov and cov[0] <= start:
+        # Cached back far enough: refetch only from a day before the last fetch (today's bar moves)
+        p1 = max(start, cov[1] - 86400)
+        try:
+            fresh = _fetch_chart(ticker, p1, now)
+        except Exception:
+            fresh = None  # keep serving the cached window (e.g. offline)
+        new_start = cov[0]
+    else:
+        p1 = start
+        fresh = _fetch_chart(ticker, p1, now)
+        new_start = start
+
+    if fresh is not None:
+        with con:
+            # The in-progress daily bar's ts moves between fetches; replace the whole refetched
+            # window so its earlier snapshot doesn't linger as a second row for the same day
+            con.execute("DELETE FROM bars WHERE symbol=? AND ts>=?", (key, p1))
+            con.executemany(
+                "INSERT OR REPLACE INTO bars(symbol, ts, open, close) VALUES (?, ?, ?, ?)",
+                zip([key] * fresh["ts"].size, fresh["ts"].tolist(), fresh["open"].tolist(), fresh["close"].tolist()),
+            )
+            con.execute(
+                "INSERT OR REPLACE INTO coverage(symbol, start, end) VALUES (?, ?, ?)",
+                (key, min(new_start, cov[0]) if cov else new_start, now),
+            )
+
+    rows = con.execute(
+        "SELECT ts, open, close FROM bars WHERE symbol=? AND ts>=? ORDER BY ts", (key, start)
+    ).fetchall()
+    if not rows:
+        return {"ts": np.zeros(0, dtype=np.int64), "open": np.zeros(0), "close": np.zeros(0)}
+    arr = np.array(rows, dtype=np.float64)
+    return {"ts": arr[:, 0].astype(np.int64), "open": arr[:, 1], "close": arr[:, 2]}
+
+
+def _fetch_chart(ticker: str, p1: int, p2: int) -> Dict[str, np.ndarray]:
+    """One Yahoo chart request for [p1, p2] as column arrays, NaN bars dropped."""
+    symbol = urllib.parse.quote(ticker.strip())
+    url = YA_BASE.format(symbol=symbol, p1=p1, p2=p2)
 
-    resp = requests.get(url, headers=headers, timeout=20)
+    resp = _session().get(url, timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content) if ORJSON_OK else resp.json()
 
     chart = data.get("chart", {})
     err = chart.get("error")
@@ -104,13 +206,80 @@ def _fetch_single(ticker: str, days: int) -> List[dict]:
     quote = (result.get("indicators", {}).get("quote") or [{}])[0]
     opens, closes = quote.get("open") or [], quote.get("close") or []
 
-    rows: List[dict] = []
-    for i in range(min(len(ts), len(opens), len(closes))):
-        if opens[i] is None or closes[i] is None:
-            continue
-        d = dt.datetime.fromtimestamp(ts[i], dt.UTC).strftime("%Y-%m-%d")
-        rows.append({"date": d, "open": round(float(opens[i]), 4), "close": round(float(closes[i]), 4)})
-    return rows
+    n = min(len(ts), len(opens), len(closes))
+    ts_arr = np.asarray(ts[:n], dtype=np.int64)
+    o = np.array(opens[:n], dtype=np.float64)   # None -> NaN
+    c = np.array(closes[:n], dtype=np.float64)
+    m = ~(np.isnan(o) | np.isnan(c))
+
+    return {"ts": ts_arr[m], "open": np.round(o[m], 4), "close": np.round(c[m], 4)}
+
+
+class _FetchSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(str, dict)  # sym, {"ts","open","close"}
+    failed = QtCore.pyqtSignal(str, str)     # sym, error text
+
+
+class FetchWorker(QtCore.QRunnable):
+    """Fetches one ticker on a QThreadPool thread; reports through self.signals."""
+    def __init__(self, sym: str, days: int):
+        super().__init__()
+        self.sym = sym
+        self.days = days
+        self.signals = _FetchSignals()  # lives on the GUI thread, so emits are queued back
+
+    def run(self):
+        try:
+            arrays = _fetch_single(self.sym, self.days)
+        except Exception as e:
+            self.signals.failed.emit(self.sym, str(e))
+            return
+        self.signals.finished.emit(self.sym, arrays)
+
+
+class FetchBatch(QtCore.QObject):
+    """Collects per-ticker results on the GUI thread; emits done(tickers, data_by_symbol, failed) once all report."""
+    progress = QtCore.pyqtSignal(int, int)  # completed, total
+    done = QtCore.pyqtSignal(list, dict, list)
+
+    def __init__(self, tickers: List[str], days: int, parent=None):
+        super().__init__(parent)
+        self._tickers = tickers
+        self._days = days
+        self._data: Dict[str, Dict[str, np.ndarray]] = {}
+        self._errors: Dict[str, str] = {}
+        self._workers: List[FetchWorker] = []
+        self._pending = len(tickers)
+
+    def start(self, pool: QtCore.QThreadPool):
+        for sym in self._tickers:
+            worker = FetchWorker(sym, self._days)
+            worker.signals.finished.connect(self._on_finished)
+            worker.signals.failed.connect(self._on_failed)
+            self._workers.append(worker)  # keep the signal carriers alive until done
+            pool.start(worker)
+
+    @QtCore.pyqtSlot(str, dict)
+    def _on_finished(self, sym: str, arrays: dict):
+        if arrays["ts"].size:
+            self._data[sym] = arrays
+        self._step()
+
+    @QtCore.pyqtSlot(str, str)
+    def _on_failed(self, sym: str, err: str):
+        self._errors[sym] = err
+        self._step()
+
+    def _step(self):
+        self._pending -= 1
+        total = len(self._tickers)
+        self.progress.emit(total - self._pending, total)
+        if self._pending == 0:
+            # Requested order for the status line, not completion order
+            data = {sym: self._data[sym] for sym in self._tickers if sym in self._data}
+            failed = [f"{sym} ({self._errors[sym]})" for sym in self._tickers if sym in self._errors]
+            self._workers.clear()
+            self.done.emit(self._tickers, data, failed)
 
 
 # ====================== Settings ======================
@@ -119,21 +288,141 @@ def load_settings():
     if not os.path.exists(SETTINGS_FILE):
         return {"enabled_modules": []}
     try:
+        if ORJSON_OK:
+            with open(SETTINGS_FILE, "rb") as f:
+                return orjson.loads(f.read())
         with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
             return json.load(f)
-    except Exception:
+    except (OSError, ValueError) as e:
+        print(f"[Settings load error] {SETTINGS_FILE}: {e}")
         return {"enabled_modules": []}
 
 def save_settings(data: dict):
+    # Write a sibling temp file and swap it in, so a crash never leaves half a settings.json
+    tmp = SETTINGS_FILE + ".tmp"
     try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-    except Exception:
-        pass
+        if ORJSON_OK:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, SETTINGS_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"[Settings save error] {SETTINGS_FILE}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+
+
+# ====================== Formatting ======================
+# Axis ticks, hover readouts and table cells repeat the same values constantly
+
+_EPOCH = dt.date(1970, 1, 1)
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_day(day: int) -> str:
+    """Days since the UNIX epoch -> YYYY-MM-DD (UTC)."""
+    return (_EPOCH + dt.timedelta(days=day)).isoformat()
+
+def _fmt_ts_date(ts: float) -> str:
+    return _fmt_day(int(ts // 86400))
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_cents(cents: int) -> str:
+    return f"{cents / 100:,.2f}"
+
+def _fmt_price(v: float) -> str:
+    if v != v or v in (float("inf"), float("-inf")):
+        return f"{v:,.2f}"
+    return _fmt_cents(round(v * 100))
+
+
+# ====================== History table ======================
+
+class HistoryTableModel(QtCore.QAbstractTableModel):
+    """Read-only (Ticker, Date, Open, Close) view over the per-symbol column arrays."""
+    HEADERS = ["Ticker", "Date", "Open", "Close"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._syms: List[str] = []
+        self._cols: List[Dict[str, np.ndarray]] = []
+        self._starts = np.zeros(0, dtype=np.int64)  # first flat row of each symbol
+        self._total = 0
+
+    def set_data(self, data_by_symbol: Dict[str, Dict[str, np.ndarray]]):
+        self.beginResetModel()
+        self._syms = sorted(data_by_symbol)
+        self._cols = [data_by_symbol[s] for s in self._syms]
+        sizes = np.array([c["ts"].size for c in self._cols], dtype=np.int64)
+        self._starts = np.concatenate(([0], np.cumsum(sizes)[:-1])) if sizes.size else sizes
+        self._total = int(sizes.sum())
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._total
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        # Only painted cells get here, so formatting is O(visible rows)
+        k = int(np.searchsorted(self._starts, index.row(), side="right")) - 1
+        i = index.row() - int(self._starts[k])
+        col = index.column()
+        if col == 0:
+            return self._syms[k]
+        cols = self._cols[k]
+        if col == 1:
+            return _fmt_ts_date(int(cols["ts"][i]))
+        return str(float(cols["open" if col == 2 else "close"][i]))
 
 
 # ====================== Chart (pyqtgraph) ======================
 
+def _build_palette() -> List[QtGui.QColor]:
+    def qc(r, g, b, a=255):
+        return QtGui.QColor(int(r), int(g), int(b), int(a))
+    okabe_ito = [
+        qc(0,114,178), qc(213,94,0), qc(86,180,233), qc(230,159,0),
+        qc(0,158,115), qc(240,228,66), qc(204,121,167), qc(0,0,0),
+        qc(148,52,110), qc(50,50,50),
+    ]
+    tableau20 = [
+        qc(31,119,180), qc(255,127,14), qc(44,160,44), qc(214,39,40),
+        qc(148,103,189), qc(140,86,75), qc(227,119,194), qc(127,127,127),
+        qc(188,189,34), qc(23,190,207), qc(174,199,232), qc(255,187,120),
+        qc(152,223,138), qc(255,152,150), qc(197,176,213), qc(196,156,148),
+        qc(247,182,210), qc(199,199,199), qc(219,219,141), qc(158,218,229)
+    ]
+    palette = []
+    for c in okabe_ito + tableau20:
+        if c.red() < 30 and c.green() < 30 and c.blue() < 30:
+            c = qc(90, 90, 90)
+        palette.append(c)
+    h = 0.11
+    gr = 0.61803398875
+    for _ in range(120):
+        h = (h + gr) % 1.0
+        if 0.05 <= h <= 0.13:
+            h = (h + 0.15) % 1.0
+        c = QtGui.QColor.fromHsvF(h, 0.95, 0.98, 1.0)
+        palette.append(c)
+    return palette
+
+
+# Built once at import; every chart indexes into the same colours and pens
+_PALETTE = _build_palette()
+_PENS = [pg.mkPen(c, width=2) for c in _PALETTE]
+
+
 class DateAxis(pg.graphicsItems.AxisItem.AxisItem):
     """Bottom axis that formats UNIX seconds -> YYYY-MM-DD (true time scale)."""
     def __init__(self, *args, **kwargs):
@@ -143,8 +432,7 @@ class DateAxis(pg.graphicsItems.AxisItem.AxisItem):
         out = []
         for v in values:
             try:
-                d = dt.datetime.fromtimestamp(v, dt.UTC).date()
-                out.append(d.strftime("%Y-%m-%d"))
+                out.append(_fmt_ts_date(v))
             except Exception:
                 out.append("")
         return out
@@ -156,11 +444,11 @@ class PriceAxis(pg.graphicsItems.AxisItem.AxisItem):
         super().__init__(orientation='left', *args, **kwargs)
 
     def tickStrings(self, values, scale, spacing):
-        return [f"{v:,.2f}" for v in values]
+        return [_fmt_price(v) for v in values]
 
 
 class PGChart(QtWidgets.QWidget):
-    """Fast pyqtgraph chart using PlotCurveItem + high-variance palette, crosshair, and series toggles."""
+    """Fast pyqtgraph chart using PlotDataItem (peak downsampling) + high-variance palette, crosshair, and series toggles."""
     def __init__(self, parent=None):
         super().__init__(parent)
         lay = QtWidgets.QVBoxLayout(self)
@@ -174,6 +462,8 @@ class PGChart(QtWidgets.QWidget):
         self.plot.setLabel('left', 'Price')
         self.plot.setMouseEnabled(x=True, y=True)
         self.plot.setClipToView(True)
+        # Decimate to roughly one min/max pair per pixel; spikes survive, hover still reads raw arrays
+        self.plot.setDownsampling(auto=True, mode='peak')
         self.plot.getViewBox().setDefaultPadding(0.05)
 
         # Crosshair items
@@ -202,49 +492,23 @@ class PGChart(QtWidgets.QWidget):
         lay.addWidget(self.series_group, 0)
 
         # Data holders
-        self._series: Dict[str, pg.PlotCurveItem] = {}
+        self._series: Dict[str, pg.PlotDataItem] = {}
         self._data_cache: Dict[str, Tuple['np.ndarray', 'np.ndarray']] = {}
+        # (shared xs, labels, ys matrix) when every series has the same dates; built on first hover
+        self._grid: Optional[Tuple[np.ndarray, List[str], np.ndarray]] = None
+        self._grid_dirty = True
+        self._batch_depth = 0  # >0 while inside batch(); autoRange deferred to exit
         self._palette_idx = 0
-        self._palette = self._make_palette()
+        self._palette = _PALETTE
 
         # Crosshair / hover
         self.plot.setMouseTracking(True)
         self.plot.scene().sigMouseMoved.connect(self._on_mouse_moved)
 
-    def _make_palette(self):
-        def qc(r, g, b, a=255):
-            return QtGui.QColor(int(r), int(g), int(b), int(a))
-        okabe_ito = [
-            qc(0,114,178), qc(213,94,0), qc(86,180,233), qc(230,159,0),
-            qc(0,158,115), qc(240,228,66), qc(204,121,167), qc(0,0,0),
-            qc(148,52,110), qc(50,50,50),
-        ]
-        tableau20 = [
-            qc(31,119,180), qc(255,127,14), qc(44,160,44), qc(214,39,40),
-            qc(148,103,189), qc(140,86,75), qc(227,119,194), qc(127,127,127),
-            qc(188,189,34), qc(23,190,207), qc(174,199,232), qc(255,187,120),
-            qc(152,223,138), qc(255,152,150), qc(197,176,213), qc(196,156,148),
-            qc(247,182,210), qc(199,199,199), qc(219,219,141), qc(158,218,229)
-        ]
-        palette = []
-        for c in okabe_ito + tableau20:
-            if c.red() < 30 and c.green() < 30 and c.blue() < 30:
-                c = qc(90, 90, 90)
-            palette.append(c)
-        h = 0.11
-        gr = 0.61803398875
-        for _ in range(120):
-            h = (h + gr) % 1.0
-            if 0.05 <= h <= 0.13:
-                h = (h + 0.15) % 1.0
-            c = QtGui.QColor.fromHsvF(h, 0.95, 0.98, 1.0)
-            palette.append(c)
-        return palette
-
-    def _next_pen(self) -> pg.mkPen:
-        color = self._palette[self._palette_idx % len(self._palette)]
+    def _next_pen(self) -> QtGui.QPen:
+        pen = _PENS[self._palette_idx % len(_PENS)]
         self._palette_idx += 1
-        return pg.mkPen(color, width=2)
+        return pen
 
     def clear(self):
         for item in list(self._series.values()):
@@ -254,6 +518,7 @@ class PGChart(QtWidgets.QWidget):
                 pass
         self._series.clear()
         self._data_cache.clear()
+        self._grid, self._grid_dirty = None, True
         self._palette_idx = 0
 
         while self.series_layout.count() > 2:
@@ -268,30 +533,48 @@ class PGChart(QtWidgets.QWidget):
         if self._hline not in self.plot.items():
             self.plot.addItem(self._hline, ignoreBounds=True)
 
-        self.plot.enableAutoRange('xy', True)
+        if not self._batch_depth:
+            self.plot.enableAutoRange('xy', True)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Add several series with one autoRange recalculation at the end."""
+        self._batch_depth += 1
+        self.plot.disableAutoRange()
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.plot.enableAutoRange('xy', True)
 
     def add_line(self, label: str, dates_utc_str: List[str], y_values: List[float]):
-        import numpy as np
+        """Legacy entry point for YYYY-MM-DD dates; prefer add_line_xs with UNIX seconds."""
         xs = np.array(
             [dt.datetime.strptime(s, "%Y-%m-%d").replace(tzinfo=dt.UTC).timestamp() for s in dates_utc_str],
             dtype=float
         )
-        ys = np.array(y_values, dtype=float)
+        self.add_line_xs(label, xs, np.asarray(y_values, dtype=float))
+
+    def add_line_xs(self, label: str, xs: np.ndarray, ys: np.ndarray):
+        """Plot ys against UNIX-second xs as-is (no date parsing)."""
+        # float32 has ~128 s resolution at current epochs, so only the prices are narrowed
+        xs = np.asarray(xs).astype(np.float64, copy=False)
+        ys = np.asarray(ys).astype(np.float32, copy=False)
 
         pen = self._next_pen()
-        curve = pg.PlotCurveItem(
-            x=xs, y=ys, pen=pen,
-            antialias=False,
-            clipToView=True
-        )
+        # Clip-to-view and peak downsampling are inherited from the plot in addItem
+        curve = pg.PlotDataItem(x=xs, y=ys, pen=pen, antialias=False)
         self.plot.addItem(curve)
 
         self._series[label] = curve
         self._data_cache[label] = (xs, ys)
+        self._grid_dirty = True
         self._add_series_checkbox(label, curve)
-        self.plot.enableAutoRange('xy', True)
+        if not self._batch_depth:
+            self.plot.enableAutoRange('xy', True)
 
-    def _add_series_checkbox(self, label: str, curve: pg.PlotCurveItem):
+    def _add_series_checkbox(self, label: str, curve: pg.PlotDataItem):
         cb = QtWidgets.QCheckBox(label)
         cb.setChecked(True)
         def _toggle(_state):
@@ -316,27 +599,72 @@ class PGChart(QtWidgets.QWidget):
 
         lines = []
         try:
-            date_str = dt.datetime.fromtimestamp(x, dt.UTC).strftime("%Y-%m-%d")
+            date_str = _fmt_ts_date(x)
         except Exception:
             date_str = ""
         lines.append(date_str)
 
-        import bisect
-        for label, (xs, ys) in self._data_cache.items():
-            if xs.size == 0:
-                continue
-            idx = bisect.bisect_left(xs, x)
-            if idx >= xs.size:
-                idx = xs.size - 1
-            if idx > 0 and abs(xs[idx] - x) > abs(xs[idx - 1] - x):
-                idx -= 1
-            val = ys[idx]
-            curve = self._series.get(label)
-            if curve is not None and curve.isVisible():
-                lines.append(f"{label}: {val:,.2f}")
+        grid = self._shared_grid()
+        if grid is not None:
+            # One lookup serves every series
+            xs, labels, ys_matrix = grid
+            vals = ys_matrix[:, self._nearest(xs, x)].tolist()
+            pairs = zip(labels, vals)
+        else:
+            pairs = (
+                (label, ys[self._nearest(xs, x)])
+                for label, (xs, ys) in self._data_cache.items() if xs.size
+            )
+        lines.extend(
+            f"{label}: {val:,.2f}" for label, val in pairs
+            if self._series.get(label) is not None and self._series[label].isVisible()
+        )
 
         self.readout.setText("   |   ".join(lines))
 
+    @staticmethod
+    def _nearest(xs: np.ndarray, x: float) -> int:
+        idx = int(np.searchsorted(xs, x))
+        if idx >= xs.size:
+            idx = xs.size - 1
+        if idx > 0 and abs(xs[idx] - x) > abs(xs[idx - 1] - x):
+            idx -= 1
+        return idx
+
+    def _shared_grid(self):
+        if self._grid_dirty:
+            self._grid_dirty = False
+            self._grid = None
+            items = [(label, xs, ys) for label, (xs, ys) in self._data_cache.items() if xs.size]
+            if items:
+                xs0 = items[0][1]
+                if all(xs.size == xs0.size and np.array_equal(xs, xs0) for _, xs, _ in items[1:]):
+                    self._grid = (xs0, [l for l, _, _ in items], np.vstack([ys for _, _, ys in items]))
+        return self._grid
+
+
+# ====================== Module loading ======================
+
+_SYS_MODULES_LOCK = threading.Lock()
+
+def _load_module_file(path: str, mod_name: str):
+    """Import one modules/*.py off the main thread; returns (mod_name, module or None)."""
+    try:
+        spec = importlib.util.spec_from_file_location(mod_name, path)
+        if not spec or not spec.loader:
+            return mod_name, None
+        mod = importlib.util.module_from_spec(spec)
+        # Registered before exec so dataclasses/typing can resolve cls.__module__
+        with _SYS_MODULES_LOCK:
+            sys.modules[mod_name] = mod
+        spec.loader.exec_module(mod)
+        return mod_name, mod
+    except Exception:
+        with _SYS_MODULES_LOCK:
+            sys.modules.pop(mod_name, None)
+        print(f"[Module load error] {os.path.basename(path)}\n{traceback.format_exc()}")
+        return mod_name, None
+
 
 # ====================== Main App ======================
 
@@ -347,12 +675,18 @@ class StockTool(QtWidgets.QWidget):
         self.setMinimumSize(1100, 700)
 
         # State (multi-asset)
-        self.data_by_symbol: Dict[str, List[dict]] = {}
+        self.data_by_symbol: Dict[str, Dict[str, np.ndarray]] = {}  # sym -> {"ts","open","close"}
         self.tickers: List[str] = []
 
         self.settings = load_settings()
+        # Canonical enabled state; the sorted list in settings is only refreshed on save
+        self._enabled = set(self.settings.get("enabled_modules", []))
         self.loaded_modules: Dict[str, BaseModule] = {}
         self.module_specs: Dict[str, dict] = {}
+        self._fetch_batch: Optional[FetchBatch] = None
+        # Dedicated pool so fetch concurrency matches the session's connection pool
+        self._fetch_pool = QtCore.QThreadPool(self)
+        self._fetch_pool.setMaxThreadCount(FETCH_WORKERS)
 
         self._build_ui()
         self._discover_modules()
@@ -435,8 +769,10 @@ class StockTool(QtWidgets.QWidget):
         hsplit.setChildrenCollapsible(False)
 
         # Table
-        self.table = QtWidgets.QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Ticker", "Date", "Open", "Close"])
+        self.table_model = HistoryTableModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self._compact_table(self.table)
         hh = self.table.horizontalHeader()
         hh.setStretchLastSection(False)
@@ -465,13 +801,20 @@ class StockTool(QtWidgets.QWidget):
         hsplit.setStretchFactor(0, 1)  # table
         hsplit.setStretchFactor(1, 3)  # chart 3x table
 
-        # Status
+        # Status + fetch progress (bar only shown while fetching)
         self.status = QtWidgets.QLabel("Ready.")
         self.status.setStyleSheet("color: gray;")
+        self.progress = QtWidgets.QProgressBar()
+        self.progress.setMaximumWidth(220)
+        self.progress.setFormat("%v / %m")
+        self.progress.setVisible(False)
+        status_row = QtWidgets.QHBoxLayout()
+        status_row.addWidget(self.status, 1)
+        status_row.addWidget(self.progress, 0)
 
         top.addLayout(row)
         top.addWidget(hsplit, 1)
-        top.addWidget(self.status)
+        top.addLayout(status_row)
 
         # -------- Modules area (bottom of vertical splitter) --------
         # Scrollable, “infinite” vertical page so modules can render at full size.
@@ -550,37 +893,32 @@ class StockTool(QtWidgets.QWidget):
         if not os.path.exists(init_path):
             open(init_path, "a", encoding="utf-8").close()
 
-        for fname in os.listdir(MODULES_DIR):
-            if not fname.endswith(".py") or fname.startswith("_"):
-                continue
+        files = [
+            (os.path.join(MODULES_DIR, fname), f"modules.{fname[:-3]}")
+            for fname in sorted(os.listdir(MODULES_DIR))
+            if fname.endswith(".py") and not fname.startswith("_")
+        ]
+        if not files:
+            return
 
-            path = os.path.join(MODULES_DIR, fname)
-            mod_name = f"modules.{fname[:-3]}"
+        # Imports (and their numpy/Qt/etc. imports) overlap; widgets are only built on this thread
+        with ThreadPoolExecutor(max_workers=min(IMPORT_WORKERS, len(files))) as ex:
+            loaded = list(ex.map(lambda f: _load_module_file(*f), files))
 
+        for mod_name, mod in loaded:
+            if mod is None:
+                continue
             try:
-                spec = importlib.util.spec_from_file_location(mod_name, path)
-                if not spec or not spec.loader:
-                    continue
-                mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(mod)
-
-                module_class = None
-                for obj_name in dir(mod):
-                    obj = getattr(mod, obj_name)
-                    try:
-                        if isinstance(obj, type) and issubclass(obj, BaseModule) and obj is not BaseModule:
-                            module_class = obj
-                            break
-                    except Exception:
-                        pass
-
+                # Subclasses register themselves on definition; no attribute scan needed
+                module_class = next(
+                    (cls for cls in BaseModule._registry if cls.__module__ == mod_name), None
+                )
                 if not module_class:
                     continue
 
-                temp: BaseModule = module_class()
-                m_id = getattr(temp, "MODULE_ID", None)
-                m_name = getattr(temp, "MODULE_NAME", None)
-                m_desc = getattr(temp, "MODULE_DESC", "")
+                m_id = getattr(module_class, "MODULE_ID", None)
+                m_name = getattr(module_class, "MODULE_NAME", None)
+                m_desc = getattr(module_class, "MODULE_DESC", "")
 
                 if not m_id or not m_name:
                     continue
@@ -592,11 +930,11 @@ class StockTool(QtWidgets.QWidget):
                 }
 
             except Exception:
-                print(f"[Module load error] {fname}\n{traceback.format_exc()}")
+                print(f"[Module load error] {mod_name}\n{traceback.format_exc()}")
 
     def _populate_modules_tab(self):
         self.modules_list.setRowCount(0)
-        enabled = set(self.settings.get("enabled_modules", []))
+        enabled = self._enabled
         for m_id, meta in sorted(self.module_specs.items(), key=lambda x: x[1]["name"].lower()):
             row = self.modules_list.rowCount()
             self.modules_list.insertRow(row)
@@ -615,7 +953,7 @@ class StockTool(QtWidgets.QWidget):
             self.modules_list.setItem(row, 2, desc_item)
 
     def _toggle_module(self, module_id: str, enable: bool):
-        enabled = set(self.settings.get("enabled_modules", []))
+        enabled = self._enabled
         if enable:
             if module_id not in enabled:
                 enabled.add(module_id)
@@ -625,8 +963,7 @@ class StockTool(QtWidgets.QWidget):
                 enabled.remove(module_id)
                 self._remove_module_widget(module_id)
 
-        self.settings["enabled_modules"] = sorted(enabled)
-        save_settings(self.settings)
+        self._save_module_settings()
 
     def _instantiate_module(self, module_id: str):
         if module_id in self.loaded_modules:
@@ -641,25 +978,24 @@ class StockTool(QtWidgets.QWidget):
             self.modules_vbox.insertWidget(self.modules_vbox.count() - 1, instance)
             instance.on_enable()
             if self.data_by_symbol:
-                instance.on_data(self.data_by_symbol, self.tickers)
+                instance.on_data_arrays(self.data_by_symbol, self.tickers)
         except Exception:
             print(f"[Module instantiate error] {module_id}\n{traceback.format_exc()}")
 
     def _remove_module_widget(self, module_id: str):
         inst = self.loaded_modules.pop(module_id, None)
         if inst is not None:
-            try:
+            with contextlib.suppress(Exception):
                 inst.on_disable()
-            except Exception:
-                pass
             inst.setParent(None)
             inst.deleteLater()
 
     def _apply_enabled_modules(self):
-        for m_id in self.settings.get("enabled_modules", []):
+        for m_id in sorted(self._enabled):
             self._instantiate_module(m_id)
 
     def _save_module_settings(self):
+        self.settings["enabled_modules"] = sorted(self._enabled)
         save_settings(self.settings)
 
     # ---------------- Fetch & render ----------------
@@ -690,20 +1026,28 @@ class StockTool(QtWidgets.QWidget):
             self.status.setText("❌ Please enter at least one ticker.")
             return
 
+        if self._fetch_batch is not None:
+            return
+
         self.status.setText("Fetching...")
-        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.WaitCursor)
+        self.fetch_btn.setEnabled(False)
+        self.progress.setRange(0, len(ordered))
+        self.progress.setValue(0)
+        self.progress.setVisible(True)
+        batch = FetchBatch(ordered, days, self)
+        batch.progress.connect(self._on_fetch_progress)
+        batch.done.connect(self._on_fetch_done)
+        self._fetch_batch = batch
+        batch.start(self._fetch_pool)
+
+    @QtCore.pyqtSlot(int, int)
+    def _on_fetch_progress(self, completed: int, total: int):
+        self.progress.setValue(completed)
+        self.status.setText(f"Fetching... {completed}/{total}")
+
+    @QtCore.pyqtSlot(list, dict, list)
+    def _on_fetch_done(self, ordered: List[str], data_by_symbol: Dict[str, Dict[str, np.ndarray]], failed: List[str]):
         try:
-            data_by_symbol: Dict[str, List[dict]] = {}
-            failed: List[str] = []
-
-            for sym in ordered:
-                try:
-                    rows = _fetch_single(sym, days)
-                    if rows:
-                        data_by_symbol[sym] = rows
-                except Exception as e:
-                    failed.append(f"{sym} ({e})")
-
             self.data_by_symbol = data_by_symbol
             self.tickers = [s for s in ordered if s in data_by_symbol]
 
@@ -723,43 +1067,34 @@ class StockTool(QtWidgets.QWidget):
             self._notify_modules()
 
         finally:
-            QtWidgets.QApplication.restoreOverrideCursor()
+            if self._fetch_batch is not None:
+                self._fetch_batch.deleteLater()
+            self._fetch_batch = None
+            self.progress.setVisible(False)
+            self.fetch_btn.setEnabled(True)
 
     def _notify_modules(self):
         for m in self.loaded_modules.values():
             try:
-                m.on_data(self.data_by_symbol, self.tickers)
+                m.on_data_arrays(self.data_by_symbol, self.tickers)
             except Exception:
                 print(f"[Module on_data error]\n{traceback.format_exc()}")
 
-    def _populate_table_multi(self, data_by_symbol: Dict[str, List[dict]]):
-        flat = []
-        for sym, rows in data_by_symbol.items():
-            for r in rows:
-                flat.append((sym, r["date"], r["open"], r["close"]))
-        flat.sort(key=lambda x: (x[0], x[1]))
-
-        self.table.setRowCount(len(flat))
-        for i, (sym, date, opn, cls) in enumerate(flat):
-            self.table.setItem(i, 0, QtWidgets.QTableWidgetItem(sym))
-            self.table.setItem(i, 1, QtWidgets.QTableWidgetItem(date))
-            self.table.setItem(i, 2, QtWidgets.QTableWidgetItem(str(opn)))
-            self.table.setItem(i, 3, QtWidgets.QTableWidgetItem(str(cls)))
-        if flat:
+    def _populate_table_multi(self, data_by_symbol: Dict[str, Dict[str, np.ndarray]]):
+        # The model reads the arrays in place; nothing is copied per row
+        self.table_model.set_data(data_by_symbol)
+        if self.table_model.rowCount():
             self.table.scrollToBottom()
-        else:
-            self.table.setRowCount(0)
 
-    def _plot_multi(self, data_by_symbol: Dict[str, List[dict]]):
-        self.chart.clear()
-        for sym, rows in data_by_symbol.items():
-            if not rows:
-                continue
-            dates = [r["date"] for r in rows]
-            closes = [r["close"] for r in rows]
-            self.chart.add_line(f"{sym} Close", dates, closes)
+    def _plot_multi(self, data_by_symbol: Dict[str, Dict[str, np.ndarray]]):
+        with self.chart.batch():
+            self.chart.clear()
+            for sym, a in data_by_symbol.items():
+                if not a["ts"].size:
+                    continue
+                self.chart.add_line_xs(f"{sym} Close", a["ts"], a["close"])
 
-    def _compact_table(self, tbl: QtWidgets.QTableWidget):
+    def _compact_table(self, tbl: QtWidgets.QTableView):
         tbl.setAlternatingRowColors(True)
         tbl.setWordWrap(False)
         tbl.setTextElideMode(QtCore.Qt.TextElideMode.ElideRight)
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fast_ops
+
+
+CASES_1D = [
+    [1, 2, 3, 4, 5],                      # int input is coerced
+    [10.0, 0.0, 5.0, 0.0, 0.0, 7.5],      # zero prices: inf/nan, never raises
+    [3.0, np.nan, 4.0, 2.0],
+    [],
+    [42.0],
+]
+CASES_2D = [
+    [[1, 2, 3], [4, 4, 4]],               # flat row -> zeros
+    [[0.5, -1.0, 2.0, 8.0], [1.0, np.nan, 3.0, 2.0]],
+]
+
+
+class PublicApiTest(unittest.TestCase):
+    def test_rolling_mean(self):
+        np.testing.assert_allclose(fast_ops.rolling_mean([1, 2, 3, 4], 2), [np.nan, 1.5, 2.5, 3.5])
+        self.assertTrue(np.isnan(fast_ops.rolling_mean([1.0, 2.0], 3)).all())
+
+    def test_pct_change_zero_price(self):
+        out = fast_ops.pct_change([2.0, 0.0, 0.0, 1.0])
+        self.assertTrue(np.isnan(out[0]))
+        self.assertEqual(out[1], -1.0)
+        self.assertTrue(np.isnan(out[2]))   # 0/0
+        self.assertTrue(np.isposinf(out[3]))  # 1/0
+
+    def test_zscore_flat_row(self):
+        out = fast_ops.zscore_matrix([[1, 2, 3], [5, 5, 5]])
+        np.testing.assert_allclose(out[1], 0.0)
+        np.testing.assert_allclose(out[0], [-1.224744871, 0.0, 1.224744871])
+
+    def test_rejects_wrong_rank(self):
+        with self.assertRaises(ValueError):
+            fast_ops.zscore_matrix([1.0, 2.0])
+
+
+@unittest.skipUnless(fast_ops.NUMBA_OK, "numba not installed")
+class BackendParityTest(unittest.TestCase):
+    def test_rolling_mean(self):
+        for case in CASES_1D:
+            x = fast_ops._as_f64(case, 1)
+            for w in (1, 2, 3, 10):
+                np.testing.assert_allclose(fast_ops._rolling_mean_nb(x, w), fast_ops._rolling_mean_np(x, w))
+
+    def test_pct_change(self):
+        for case in CASES_1D:
+            x = fast_ops._as_f64(case, 1)
+            np.testing.assert_allclose(fast_ops._pct_change_nb(x), fast_ops._pct_change_np(x))
+
+    def test_zscore_matrix(self):
+        for case in CASES_2D:
+            ys = fast_ops._as_f64(case, 2)
+            np.testing.assert_allclose(fast_ops._zscore_matrix_nb(ys), fast_ops._zscore_matrix_np(ys))
+
+
+if __name__ == "__main__":
+    unittest.main()
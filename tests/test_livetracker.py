@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6 import QtCore, QtWidgets
+
+from modules.livetracker import LivePriceTrackerModule as M, Quote, QuoteTableModel
+
+
+def _quote(sym, price, prev):
+    chg = price - prev
+    return Quote(sym, price, prev, price, price, 100, "USD", "EQUITY", "10:00", False, chg, chg / prev * 100)
+
+
+class DeferredRowTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.model = QuoteTableModel()
+        self.model.set_symbols(["AAA", "BBB"])
+        self.model.update_quotes({"AAA": _quote("AAA", 10.0, 8.0), "BBB": _quote("BBB", 5.0, 4.5)}, visible={"AAA"})
+
+    def test_hidden_row_is_deferred(self):
+        self.assertIn("BBB", self.model._deferred)
+        self.assertNotIn("BBB", self.model._data)
+
+    def test_symbol_and_sort_reads_do_not_format(self):
+        self.assertEqual(self.model.data(self.model.index(1, M.COL_SYMBOL)), "BBB")
+        self.assertEqual(self.model.data(self.model.index(1, M.COL_PRICE), QuoteTableModel.SORT_ROLE), 5.0)
+        self.assertEqual(self.model.data(self.model.index(1, M.COL_TIME), QuoteTableModel.SORT_ROLE), "10:00")
+        self.assertIn("BBB", self.model._deferred)
+
+    def test_display_read_catches_up(self):
+        self.assertEqual(self.model.data(self.model.index(1, M.COL_PRICE)), M._fmt_price(5.0))
+        self.assertNotIn("BBB", self.model._deferred)
+
+    def test_proxy_sorts_on_raw_values(self):
+        proxy = QtCore.QSortFilterProxyModel()
+        proxy.setSourceModel(self.model)
+        proxy.setSortRole(QuoteTableModel.SORT_ROLE)
+        proxy.sort(M.COL_PRICE, QtCore.Qt.SortOrder.AscendingOrder)
+        # Numeric, not text: 5.00 before 10.00
+        self.assertEqual(proxy.data(proxy.index(0, M.COL_SYMBOL)), "BBB")
+        self.assertIn("BBB", self.model._deferred)
+
+
+if __name__ == "__main__":
+    unittest.main()
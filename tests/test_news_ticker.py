@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6 import QtWidgets
+
+from modules.news_ticker import NewsTickerModule
+
+
+class SaveDebounceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.m = NewsTickerModule()
+
+    def tearDown(self):
+        self.m.deleteLater()
+
+    def test_slider_keeps_debounce_interval(self):
+        self.m.speed_slider.setValue(self.m.speed_slider.value() % self.m.speed_slider.maximum() + 1)
+        self.assertTrue(self.m._save_timer.isActive())
+        self.assertEqual(self.m._save_timer.interval(), 1000)
+
+    def test_spinbox_keeps_debounce_interval(self):
+        self.m.refresh_every_sb.setValue(self.m.refresh_every_sb.value() + 1)
+        self.assertTrue(self.m._save_timer.isActive())
+        self.assertEqual(self.m._save_timer.interval(), 1000)
+
+    def test_feed_edit_keeps_debounce_interval(self):
+        self.m.refresh_every_sb.setValue(self.m.refresh_every_sb.value() + 1)
+        self.m.feeds_edit.setPlainText("https://example.com/rss")
+        self.assertEqual(self.m._save_timer.interval(), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()